@@ -3,6 +3,7 @@ import numpy as np
 import os
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+from multiprocessing import Pool
 from pathlib import Path
 from threading import Thread
 
@@ -23,11 +24,16 @@ def process_logic(input_path, output_path, sigma=2.5, min_brightness=120, trim_p
     
     normalized = np.clip((img_float - min_val) / (max_val - min_val), 0, 1)
     output_float = normalized * (255 - min_brightness) + min_brightness
-    final_result = cv2.bitwise_and(output_float.astype(np.uint8), output_float.astype(np.uint8), mask=mask)
+    output_u8 = output_float.astype(np.uint8)
+    final_result = cv2.bitwise_and(output_u8, output_u8, mask=mask)
     
     cv2.imwrite(str(output_path), final_result)
     return True
 
+def _process_pair(paths):
+    """Pool 用: (入力パス, 出力パス) の組を処理する"""
+    return process_logic(*paths)
+
 class CTApp:
     def __init__(self, root):
         self.root = root
@@ -72,12 +78,16 @@ class CTApp:
             return
 
         out_dir.mkdir(parents=True, exist_ok=True)
-        files = list(in_dir.glob("*.tif*")) + list(in_dir.glob("*.TIF*"))
+        # 大文字小文字を区別しない環境では両方の glob が同じファイルを返すため重複を除く
+        files = sorted(set(in_dir.glob("*.tif*")) | set(in_dir.glob("*.TIF*")))
 
         self.btn_run.config(state=tk.DISABLED)
-        for i, f in enumerate(files):
-            self.status_label.config(text=f"処理中... ({i+1}/{len(files)})")
-            process_logic(f, out_dir / f.name)
+        # ファイルごとに独立しているのでプロセスプールで並列に変換する
+        jobs = [(f, out_dir / f.name) for f in files]
+        if jobs:
+            with Pool(min(os.cpu_count() or 1, len(jobs))) as pool:
+                for i, _ in enumerate(pool.imap_unordered(_process_pair, jobs, chunksize=4)):
+                    self.status_label.config(text=f"処理中... ({i+1}/{len(files)})")
         
         self.status_label.config(text="完了しました！", fg="green")
         self.btn_run.config(state=tk.NORMAL)
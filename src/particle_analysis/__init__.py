@@ -22,19 +22,50 @@ from .contact import count_contacts, save_contact_csv, analyze_contacts
 
 from .config import DEFAULT_CONFIG, PipelineConfig
 from .utils import setup_logging, Timer, ensure_directory, get_image_files, natural_sort_key
-from .visualize import view_volume, NapariUnavailable
+# Visualization and GUI import napari/Qt, so they are loaded on first access.
+# This keeps processes that only need the analysis code (e.g. the radius-sweep
+# pool workers, which import this package to unpickle their task) light.
+_LAZY_ATTRS = {
+    "view_volume": ".visualize",
+    "NapariUnavailable": ".visualize",
+    "launch_gui": ".gui",
+    "ParticleAnalysisGUI": ".gui",
+    "GUIUnavailable": ".gui",
+    "GUI_AVAILABLE": ".gui",
+}
 
-# GUI (optional, requires additional dependencies)
-try:
-    from .gui import launch_gui, ParticleAnalysisGUI, GUIUnavailable, GUI_AVAILABLE
-except ImportError:
-    GUI_AVAILABLE = False
+
+def _gui_fallback(name):
+    """Stand-ins used when the optional GUI dependencies are missing."""
     def launch_gui():
         raise ImportError("GUI dependencies not available. Install with: pip install napari[all] qtpy")
     def ParticleAnalysisGUI():
         raise ImportError("GUI dependencies not available. Install with: pip install napari[all] qtpy")
     class GUIUnavailable(RuntimeError):
         pass
+    return {
+        "launch_gui": launch_gui,
+        "ParticleAnalysisGUI": ParticleAnalysisGUI,
+        "GUIUnavailable": GUIUnavailable,
+        "GUI_AVAILABLE": False,
+    }[name]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        # GUI (optional, requires additional dependencies)
+        if module_name != ".gui":
+            raise
+        value = _gui_fallback(name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Processing
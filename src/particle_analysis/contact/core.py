@@ -12,10 +12,149 @@ from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; count_contacts falls back to NumPy
+    njit = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
 
+def _half_offsets(connectivity: int) -> np.ndarray:
+    """Forward half of the neighbourhood: each unordered voxel pair is visited once."""
+    if connectivity == 6:
+        return np.array([(0, 0, 1), (0, 1, 0), (1, 0, 0)], dtype=np.int64)
+    offsets = [
+        (dz, dy, dx)
+        for dz in (-1, 0, 1) for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+        if (dz, dy, dx) > (0, 0, 0)
+    ]
+    return np.array(offsets, dtype=np.int64)
+
+
+if njit is not None:
+    @njit(inline='always', cache=True)
+    def _seen_left(labels, z, y, x, zz, yy, xx, a, b):
+        """The voxel to the left already produced this pair along the same offset."""
+        return x > 0 and xx > 0 and labels[z, y, x - 1] == a and labels[zz, yy, xx - 1] == b
+
+    @njit(parallel=True, cache=True)
+    def _njit_contact_pairs(labels, offsets, stride):
+        """Return packed ``lo * stride + hi`` keys for touching voxel pairs.
+
+        A pair already emitted by the left-hand voxel along the same offset is
+        skipped, which removes most duplicates inside runs of equal labels.
+
+        Two passes over z-slices in parallel: the first counts pairs per slice,
+        the second writes them at the slice's offset in the output array.
+        """
+        Z, H, W = labels.shape
+        n_off = offsets.shape[0]
+
+        per_slice = np.zeros(Z, dtype=np.int64)
+        for z in prange(Z):
+            c = 0
+            for y in range(H):
+                for x in range(W):
+                    a = labels[z, y, x]
+                    if a <= 0:
+                        continue
+                    for k in range(n_off):
+                        zz = z + offsets[k, 0]
+                        yy = y + offsets[k, 1]
+                        xx = x + offsets[k, 2]
+                        if zz < 0 or zz >= Z or yy < 0 or yy >= H or xx < 0 or xx >= W:
+                            continue
+                        b = labels[zz, yy, xx]
+                        if b > 0 and b != a and not _seen_left(labels, z, y, x, zz, yy, xx, a, b):
+                            c += 1
+            per_slice[z] = c
+
+        starts = np.zeros(Z + 1, dtype=np.int64)
+        for z in range(Z):
+            starts[z + 1] = starts[z] + per_slice[z]
+
+        keys = np.empty(starts[Z], dtype=np.int64)
+        for z in prange(Z):
+            pos = starts[z]
+            for y in range(H):
+                for x in range(W):
+                    a = labels[z, y, x]
+                    if a <= 0:
+                        continue
+                    for k in range(n_off):
+                        zz = z + offsets[k, 0]
+                        yy = y + offsets[k, 1]
+                        xx = x + offsets[k, 2]
+                        if zz < 0 or zz >= Z or yy < 0 or yy >= H or xx < 0 or xx >= W:
+                            continue
+                        b = labels[zz, yy, xx]
+                        if b > 0 and b != a and not _seen_left(labels, z, y, x, zz, yy, xx, a, b):
+                            if a < b:
+                                keys[pos] = np.int64(a) * stride + b
+                            else:
+                                keys[pos] = np.int64(b) * stride + a
+                            pos += 1
+        return keys
+
+
+def _contact_degrees(keys: np.ndarray, stride: int) -> Dict[int, int]:
+    """Per-label number of distinct neighbours from packed ``lo * stride + hi`` keys."""
+    keys = np.unique(keys)
+    lo, hi = np.divmod(keys, stride)
+    counts = np.bincount(lo, minlength=stride) + np.bincount(hi, minlength=stride)
+    return {pid: int(counts[pid]) for pid in range(1, stride)}
+
+
+def _count_contacts_numba(labels: np.ndarray, connectivity: int, max_label: int) -> Dict[int, int]:
+    """Numba-accelerated contact counting (same result as the NumPy path)."""
+    stride = int(max_label) + 1
+    keys = _njit_contact_pairs(np.ascontiguousarray(labels), _half_offsets(connectivity), stride)
+    return _contact_degrees(keys, stride)
+
+
+def _count_contacts_numpy(
+    labels: np.ndarray,
+    connectivity: int,
+    max_label: int,
+    slab_bytes: int = 8 << 20,
+) -> Dict[int, int]:
+    """Vectorised contact counting with shifted comparisons on z-slabs.
+
+    The volume is processed in slabs of about *slab_bytes* (plus a one-plane
+    halo for the forward z offsets) so that the shifted views and masks of a
+    slab stay cache-resident. Touching label pairs are packed into int64 keys
+    and deduplicated.
+    """
+    stride = int(max_label) + 1
+    Z, H, W = labels.shape
+    offsets = _half_offsets(connectivity)  # dz is 0 or 1 for every forward offset
+    slab_z = max(1, slab_bytes // max(1, H * W * labels.itemsize))
+    pair_keys = []
+    for z0 in tqdm(range(0, Z, slab_z), desc="Scanning slabs"):
+        nz = min(slab_z, Z - z0)
+        block = labels[z0:z0 + nz + 1]
+        slab_keys = []
+        for dz, dy, dx in offsets:
+            n_src = min(nz, block.shape[0] - dz)
+            if n_src <= 0:
+                continue
+            a = block[0:n_src, max(0, -dy):H - max(0, dy), max(0, -dx):W - max(0, dx)]
+            b = block[dz:dz + n_src, max(0, dy):H - max(0, -dy), max(0, dx):W - max(0, -dx)]
+            mask = (a != b) & (a > 0) & (b > 0)
+            if not mask.any():
+                continue
+            a = a[mask].astype(np.int64)
+            b = b[mask].astype(np.int64)
+            slab_keys.append(np.minimum(a, b) * stride + np.maximum(a, b))
+        if slab_keys:
+            # Deduplicate per slab to keep the concatenated key array small
+            pair_keys.append(np.unique(np.concatenate(slab_keys)))
+
+    keys = np.concatenate(pair_keys) if pair_keys else np.empty(0, dtype=np.int64)
+    return _contact_degrees(keys, stride)
+
+
 def count_contacts(
     labels: np.ndarray,
     connectivity: int = 26,
@@ -34,90 +173,50 @@ def count_contacts(
         Dict mapping particle_id -> contact_count
         If use_guard_volume=True, only interior particles are included.
     """
-    if connectivity == 6:
-        # Face-connected neighbors (6 directions)
-        offsets = [(-1,0,0), (1,0,0), (0,-1,0), (0,1,0), (0,0,-1), (0,0,1)]
-    elif connectivity == 26:
-        # Full 26-connected neighborhood
-        offsets = []
-        for dz in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                for dx in [-1, 0, 1]:
-                    if (dx, dy, dz) != (0, 0, 0):
-                        offsets.append((dz, dy, dx))
-    else:
+    if connectivity not in (6, 26):
         raise ValueError(f"Unsupported connectivity: {connectivity}. Use 6 or 26.")
     
-    Z, H, W = labels.shape
-    max_label = labels.max()
+    max_label = int(labels.max()) if labels.size else 0
     
     logger.info(f"Max label id: {max_label}")
     
-    # Initialize contact sets for each particle
-    contacts = {pid: set() for pid in range(1, max_label + 1)}
-    
-    # Scan all neighbor directions
-    for dz, dy, dx in tqdm(offsets, desc="Scanning neighbors"):
-        # Create shifted versions of the labels
-        if dz == 0 and dy == 0 and dx == 0:
-            continue
-            
-        # Calculate valid slice ranges
-        z_start = max(0, -dz)
-        z_end = min(Z, Z - dz)
-        y_start = max(0, -dy)
-        y_end = min(H, H - dy)
-        x_start = max(0, -dx)
-        x_end = min(W, W - dx)
-        
-        if z_start >= z_end or y_start >= y_end or x_start >= x_end:
-            continue
-        
-        # Get current and neighbor slices
-        current_slice = labels[z_start:z_end, y_start:y_end, x_start:x_end]
-        neighbor_slice = labels[z_start+dz:z_end+dz, y_start+dy:y_end+dy, x_start+dx:x_end+dx]
-        
-        # Find contacts (different non-zero labels)
-        contact_mask = (current_slice > 0) & (neighbor_slice > 0) & (current_slice != neighbor_slice)
-        
-        if contact_mask.any():
-            current_contacts = current_slice[contact_mask]
-            neighbor_contacts = neighbor_slice[contact_mask]
-            
-            # Add contacts to sets (bidirectional)
-            for curr, neigh in zip(current_contacts, neighbor_contacts):
-                contacts[curr].add(neigh)
-                contacts[neigh].add(curr)
-    
-    # Convert sets to counts
-    contact_counts = {pid: len(contact_set) for pid, contact_set in contacts.items()}
+    if njit is not None and labels.dtype.kind in 'iu' and max_label < 2**31:
+        contact_counts = _count_contacts_numba(labels, connectivity, max_label)
+    else:
+        contact_counts = _count_contacts_numpy(labels, connectivity, max_label)
     
     # Apply guard volume filtering if requested
     if use_guard_volume:
-        from .guard_volume import (
-            calculate_guard_margin,
-            create_guard_volume_mask,
-            filter_interior_particles
-        )
-        
-        margin = calculate_guard_margin(labels)
-        guard_mask = create_guard_volume_mask(labels.shape, margin)
-        interior_particles = filter_interior_particles(labels, guard_mask)
-        
-        # Filter to interior particles only
-        contact_counts = {
-            pid: count for pid, count in contact_counts.items()
-            if pid in interior_particles
-        }
-        
-        logger.info(
-            f"Guard volume filtering applied: {len(contact_counts)} interior particles "
-            f"out of {len(contacts)} total"
-        )
+        contact_counts = _apply_guard_volume(labels, contact_counts)
     
     return contact_counts
 
 
+def _apply_guard_volume(labels: np.ndarray, contact_counts: Dict[int, int]) -> Dict[int, int]:
+    """Restrict *contact_counts* to particles fully inside the guard volume."""
+    from .guard_volume import (
+        calculate_guard_margin,
+        create_guard_volume_mask,
+        filter_interior_particles
+    )
+    
+    margin = calculate_guard_margin(labels)
+    guard_mask = create_guard_volume_mask(labels.shape, margin)
+    interior_particles = filter_interior_particles(labels, guard_mask)
+    
+    # Filter to interior particles only
+    interior_counts = {
+        pid: count for pid, count in contact_counts.items()
+        if pid in interior_particles
+    }
+    
+    logger.info(
+        f"Guard volume filtering applied: {len(interior_counts)} interior particles "
+        f"out of {len(contact_counts)} total"
+    )
+    return interior_counts
+
+
 def save_contact_csv(contacts: Dict[int, int], out_csv: str) -> None:
     """Save contact counts to CSV file.
     
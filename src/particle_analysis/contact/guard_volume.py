@@ -14,7 +14,10 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
-def calculate_max_particle_radius(labels: np.ndarray) -> float:
+def calculate_max_particle_radius(
+    labels: np.ndarray,
+    label_counts: Optional[np.ndarray] = None
+) -> float:
     """Calculate the maximum equivalent radius of particles.
     
     The equivalent radius is calculated assuming spherical particles:
@@ -22,27 +25,27 @@ def calculate_max_particle_radius(labels: np.ndarray) -> float:
     
     Args:
         labels: 3D labeled volume (particle IDs)
+        label_counts: Optional pre-computed ``np.bincount(labels.ravel())``
+            (skips the pass over *labels*)
         
     Returns:
         Maximum equivalent radius in voxels (float)
     """
-    if labels.max() == 0:
+    if label_counts is None:
+        flat = np.ravel(labels)
+        if flat.size and flat.dtype.kind == 'i' and flat.min() < 0:
+            flat = flat[flat > 0]
+        # One pass over the volume: label_counts[i] is the voxel count of label i
+        label_counts = np.bincount(flat) if flat.size else np.zeros(1, dtype=np.intp)
+    if len(label_counts) < 2 or not label_counts[1:].any():
         logger.warning("No particles found in labels")
         return 0.0
     
-    unique_labels = np.unique(labels)
-    unique_labels = unique_labels[unique_labels > 0]  # Remove background
-    
-    if len(unique_labels) == 0:
-        return 0.0
+    largest_volume = int(label_counts[1:].max())
     
-    max_radius = 0.0
-    for label_id in unique_labels:
-        volume = np.sum(labels == label_id)
-        if volume > 0:
-            # Equivalent radius: V = (4/3)πr³ => r = (3V/4π)^(1/3)
-            equivalent_radius = np.power(3.0 * volume / (4.0 * np.pi), 1.0 / 3.0)
-            max_radius = max(max_radius, equivalent_radius)
+    # The largest particle has the largest equivalent radius:
+    # V = (4/3)πr³ => r = (3V/4π)^(1/3)
+    max_radius = float(np.power(3.0 * largest_volume / (4.0 * np.pi), 1.0 / 3.0))
     
     logger.info(f"Maximum particle equivalent radius: {max_radius:.2f} voxels")
     return max_radius
@@ -51,7 +54,8 @@ def calculate_max_particle_radius(labels: np.ndarray) -> float:
 def calculate_guard_margin(
     labels: np.ndarray,
     min_margin: int = 10,
-    margin_multiplier: float = 2.0
+    margin_multiplier: float = 2.0,
+    label_counts: Optional[np.ndarray] = None
 ) -> int:
     """Calculate guard margin based on maximum particle size.
     
@@ -73,11 +77,12 @@ def calculate_guard_margin(
         labels: 3D labeled volume
         min_margin: Minimum margin in voxels (default: 10 = 140μm at 14μm/voxel)
         margin_multiplier: Multiplier for max particle radius (default: 2.0)
+        label_counts: Optional pre-computed ``np.bincount(labels.ravel())``
         
     Returns:
         Guard margin in voxels (int)
     """
-    max_radius = calculate_max_particle_radius(labels)
+    max_radius = calculate_max_particle_radius(labels, label_counts)
     calculated_margin = int(np.ceil(max_radius * margin_multiplier))
     margin = max(calculated_margin, min_margin)
     
@@ -121,25 +126,17 @@ def create_guard_volume_mask(
         Boolean mask (True = interior, False = boundary region)
     """
     Z, H, W = shape
+    m = max(int(margin), 0)
     
-    # Create coordinate arrays
-    z_coords = np.arange(Z)
-    y_coords = np.arange(H)
-    x_coords = np.arange(W)
-    
-    # Create meshgrid
-    zz, yy, xx = np.meshgrid(z_coords, y_coords, x_coords, indexing='ij')
-    
-    # Check if coordinates are within interior region
-    interior_mask = (
-        (zz >= margin) & (zz < Z - margin) &
-        (yy >= margin) & (yy < H - margin) &
-        (xx >= margin) & (xx < W - margin)
-    )
+    # The interior is a box, so fill it by slicing instead of comparing
+    # full-size coordinate grids
+    interior_mask = np.zeros(shape, dtype=bool)
+    interior_mask[m:Z - m, m:H - m, m:W - m] = True
     
+    n_interior = max(Z - 2 * m, 0) * max(H - 2 * m, 0) * max(W - 2 * m, 0)
     logger.info(
-        f"Guard volume mask created: {interior_mask.sum()} interior voxels "
-        f"out of {interior_mask.size} total ({100.0 * interior_mask.sum() / interior_mask.size:.1f}%)"
+        f"Guard volume mask created: {n_interior} interior voxels "
+        f"out of {interior_mask.size} total ({100.0 * n_interior / max(interior_mask.size, 1):.1f}%)"
     )
     
     return interior_mask
@@ -147,7 +144,8 @@ def create_guard_volume_mask(
 
 def filter_interior_particles(
     labels: np.ndarray,
-    guard_mask: np.ndarray
+    guard_mask: np.ndarray,
+    label_counts: Optional[np.ndarray] = None
 ) -> Set[int]:
     """Identify particles that are completely within the guard volume.
     
@@ -157,6 +155,7 @@ def filter_interior_particles(
     Args:
         labels: 3D labeled volume (particle IDs)
         guard_mask: Boolean mask (True = interior region)
+        label_counts: Optional pre-computed ``np.bincount(labels.ravel())``
         
     Returns:
         Set of particle IDs that are completely interior
@@ -166,25 +165,24 @@ def filter_interior_particles(
             f"Shape mismatch: labels {labels.shape} vs guard_mask {guard_mask.shape}"
         )
     
-    unique_labels = np.unique(labels)
-    unique_labels = unique_labels[unique_labels > 0]  # Remove background
-    
-    interior_particles = set()
-    
-    for label_id in unique_labels:
-        particle_mask = (labels == label_id)
-        particle_voxels = particle_mask.sum()
-        
-        if particle_voxels == 0:
-            continue
-        
-        # Check if all voxels are in interior
-        interior_voxels = (particle_mask & guard_mask).sum()
-        
-        if interior_voxels == particle_voxels:
-            interior_particles.add(label_id)
-    
-    total_particles = len(unique_labels)
+    # Two bincounts instead of a full-volume comparison per label: a particle
+    # is interior iff none of its voxels fall outside the guard mask
+    if label_counts is None:
+        flat = np.ravel(labels)
+        if flat.size and flat.dtype.kind == 'i' and flat.min() < 0:
+            flat = flat[flat > 0]
+        label_counts = np.bincount(flat, minlength=1)
+    outside = labels[~guard_mask]
+    if outside.size and outside.dtype.kind == 'i' and outside.min() < 0:
+        outside = outside[outside > 0]
+    outside_counts = np.bincount(outside, minlength=len(label_counts))
+    
+    present = label_counts > 0
+    present[0] = False  # Remove background
+    interior_ids = np.flatnonzero(present & (outside_counts[:len(label_counts)] == 0))
+    interior_particles = set(interior_ids.tolist())
+    
+    total_particles = int(np.count_nonzero(present))
     excluded_particles = total_particles - len(interior_particles)
     
     logger.info(
@@ -199,7 +197,8 @@ def count_contacts_with_guard(
     labels: np.ndarray,
     connectivity: int = 26,
     guard_mask: Optional[np.ndarray] = None,
-    interior_particles: Optional[Set[int]] = None
+    interior_particles: Optional[Set[int]] = None,
+    label_counts: Optional[np.ndarray] = None
 ) -> Tuple[Dict[int, int], Dict[int, int], Dict[str, int]]:
     """Count contacts with guard volume filtering.
     
@@ -213,6 +212,8 @@ def count_contacts_with_guard(
         connectivity: Neighborhood connectivity (6 or 26)
         guard_mask: Optional pre-computed guard mask (if None, will be created)
         interior_particles: Optional pre-computed interior particle set
+        label_counts: Optional pre-computed ``np.bincount(labels.ravel())``,
+            reused for the guard margin instead of another pass over *labels*
         
     Returns:
         Tuple of:
@@ -230,15 +231,15 @@ def count_contacts_with_guard(
     # Always compute guard mask and interior particles (even if provided, we log the process)
     if guard_mask is None:
         logger.info("Computing guard volume mask...")
-        margin = calculate_guard_margin(labels)
+        margin = calculate_guard_margin(labels, label_counts=label_counts)
         guard_mask = create_guard_volume_mask(labels.shape, margin)
-        logger.info(f"Guard mask created: {guard_mask.sum()} interior voxels out of {guard_mask.size} total")
+        logger.info(f"Guard mask created: {np.count_nonzero(guard_mask)} interior voxels out of {guard_mask.size} total")
     else:
-        logger.info(f"Using provided guard mask: {guard_mask.sum()} interior voxels")
+        logger.info(f"Using provided guard mask: {np.count_nonzero(guard_mask)} interior voxels")
     
     if interior_particles is None:
         logger.info("Filtering interior particles...")
-        interior_particles = filter_interior_particles(labels, guard_mask)
+        interior_particles = filter_interior_particles(labels, guard_mask, label_counts)
         logger.info(f"Interior particles identified: {len(interior_particles)} particles")
     else:
         logger.info(f"Using provided interior particles: {len(interior_particles)} particles")
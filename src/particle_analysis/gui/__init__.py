@@ -7,8 +7,10 @@ This package provides a comprehensive graphical user interface with modular comp
 - 3D visualization integration
 """
 
+import importlib.util
+
 from .main_window import ParticleAnalysisGUI
-from .workers import OptimizationWorker
+from .workers import OptimizationWorker, ProgressEvent
 from .widgets import ResultsTable, ResultsPlotter
 from .launcher import launch_gui, GUIUnavailable
 from .pipeline_handler import PipelineHandler
@@ -19,15 +21,20 @@ MISSING_DEPS = []
 
 try:
     import napari
-    import matplotlib.pyplot as plt
     from qtpy.QtWidgets import QWidget
 except ImportError as e:
     GUI_AVAILABLE = False
     MISSING_DEPS.append(str(e))
 
+# matplotlib is imported lazily by the plot widgets; only check it is installed
+if importlib.util.find_spec("matplotlib") is None:
+    GUI_AVAILABLE = False
+    MISSING_DEPS.append("No module named 'matplotlib'")
+
 __all__ = [
     "ParticleAnalysisGUI",
     "OptimizationWorker", 
+    "ProgressEvent",
     "ResultsTable",
     "ResultsPlotter",
     "launch_gui",
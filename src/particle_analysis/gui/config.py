@@ -4,6 +4,8 @@ This module contains all GUI-related constants and configuration values
 to avoid magic numbers and improve maintainability.
 """
 
+import os
+
 # === Window Configuration ===
 WINDOW_TITLE = "3D Particle Analysis Pipeline"
 WINDOW_MIN_WIDTH = 1400
@@ -30,6 +32,11 @@ BUTTON_MIN_HEIGHT = 40
 DEFAULT_MAX_RADIUS = 7
 DEFAULT_MIN_RADIUS = 1
 DEFAULT_CONNECTIVITY = 6  # 6-neighborhood (face contact)
+# Processes for evaluating radii in parallel. Each process holds its own
+# full-size intermediates, so the sweep is serial unless raised in the GUI
+# (the optimizer further caps it by available memory)
+DEFAULT_N_JOBS = 1
+MAX_N_JOBS = max(1, os.cpu_count() or 1)
 
 # === Progress Bar Configuration ===
 PROGRESS_BAR_HEIGHT = 30
@@ -4,6 +4,7 @@ This module handles GUI application startup, dependency checking,
 and error handling for the particle analysis interface.
 """
 
+import importlib.util
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,9 +24,8 @@ def _ensure_gui_available():
     except ImportError:
         missing_deps.append("napari")
     
-    try:
-        import matplotlib.pyplot as plt
-    except ImportError:
+    # matplotlib is imported lazily by the plot widgets; only check it is installed
+    if importlib.util.find_spec("matplotlib") is None:
         missing_deps.append("matplotlib")
     
     try:
@@ -8,8 +8,6 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-import numpy as np
-
 from .utils import setup_gui_logging
 
 # Setup logging (only once, avoids duplicate configuration)
@@ -31,12 +29,12 @@ from .pipeline_handler import PipelineHandler
 from .config import (
     WINDOW_TITLE, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT,
     WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT,
-    DEFAULT_MAX_RADIUS, SUPPORTED_TIF_FORMATS,
-    OUTPUT_CSV_NAME, OUTPUT_BEST_LABELS_NAME,
+    DEFAULT_MAX_RADIUS, DEFAULT_N_JOBS, MAX_N_JOBS, SUPPORTED_TIF_FORMATS,
     CONNECTIVITY_NAMES, STAGE_TEXT_MAP
 )
 from .metrics_calculator import MetricsCalculator
-from .napari_integration import NapariViewerManager, NAPARI_AVAILABLE
+from .napari_integration import NapariViewerManager
+from ..utils.common import resolve_labels_path
 from .utils import handle_napari_error, check_napari_available
 
 logger = logging.getLogger(__name__)
@@ -330,6 +328,17 @@ class ParticleAnalysisGUI(QWidget):
         self.radius_preview_label = QLabel("")
         self.radius_preview_label.setStyleSheet("color: #5a9bd3; font-size: 10pt; padding: 8px;")
         radius_layout.addWidget(self.radius_preview_label, 2, 0, 1, 2)
+
+        radius_layout.addWidget(QLabel("Parallel Processes:"), 3, 0)
+        self.n_jobs_spinbox = QSpinBox()
+        self.n_jobs_spinbox.setRange(1, MAX_N_JOBS)
+        self.n_jobs_spinbox.setValue(DEFAULT_N_JOBS)
+        self.n_jobs_spinbox.setToolTip(
+            "Radii evaluated at the same time in separate processes (default: 1).\n"
+            "Each process needs memory for a full copy of the intermediates;\n"
+            "the count is reduced automatically if memory is short."
+        )
+        radius_layout.addWidget(self.n_jobs_spinbox, 3, 1)
         
         layout.addWidget(radius_widget)
         
@@ -478,7 +487,7 @@ class ParticleAnalysisGUI(QWidget):
         self.start_btn.clicked.connect(self.start_analysis)
         self.cancel_btn.clicked.connect(self.cancel_analysis)
         self.view_3d_btn.clicked.connect(self.view_3d_results)
-        self.results_table.itemSelectionChanged.connect(self.on_table_selection_changed)
+        self.results_table.selectionModel().selectionChanged.connect(self.on_table_selection_changed)
     
     def select_ct_folder(self):
         """Select CT images folder for complete processing."""
@@ -542,6 +551,11 @@ class ParticleAnalysisGUI(QWidget):
     
     def start_analysis(self):
         """Start the analysis process."""
+        if self.is_busy():
+            # Two workers would race on output files; wait for the first to stop
+            self.status_label.setText("An analysis is still running; please wait for it to finish.")
+            return
+        
         if not self.ct_folder_path:
             QMessageBox.warning(self, "Warning", "Please select CT images folder first.")
             return
@@ -612,18 +626,17 @@ class ParticleAnalysisGUI(QWidget):
                 connectivity=connectivity,
                 tau_ratio=tau_ratio,
                 contacts_range=(cmin, cmax),
-                smoothing_window=smoothing_window
+                smoothing_window=smoothing_window,
+                n_jobs=int(self.n_jobs_spinbox.value()),
             )
             
             # Connect worker signals
-            self.optimization_worker.progress_updated.connect(self.on_progress_updated)
+            self.optimization_worker.progress_event.connect(self.on_progress_event)
             self.optimization_worker.optimization_complete.connect(self.on_optimization_complete)
             self.optimization_worker.error_occurred.connect(self.on_error_occurred)
-            
-            # NEW: Connect detailed progress signals
-            self.optimization_worker.progress_text_updated.connect(self.update_status_text)
-            self.optimization_worker.progress_percentage_updated.connect(self.update_progress_bar)
-            self.optimization_worker.stage_changed.connect(self.update_stage_indicator)
+            self.optimization_worker.csv_saved.connect(self.on_csv_saved)
+            worker = self.optimization_worker
+            worker.finished.connect(lambda: self.on_worker_finished(worker))
             
             # Start worker
             self.optimization_worker.start()
@@ -633,15 +646,50 @@ class ParticleAnalysisGUI(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to start analysis:\n\n{str(e)}")
             self.reset_ui_after_analysis()
     
+    def is_busy(self) -> bool:
+        """Return True while an optimization worker thread is still running."""
+        return self.optimization_worker is not None and self.optimization_worker.isRunning()
+    
+    def on_worker_finished(self, worker):
+        """Release the worker once its thread has actually stopped."""
+        if self.optimization_worker is worker:
+            self.optimization_worker = None
+    
     def cancel_analysis(self):
-        """Cancel the ongoing analysis."""
+        """Cancel the ongoing analysis.
+        
+        The worker stops at the next radius boundary; the UI is reset once
+        its thread has finished so that the GUI is not blocked meanwhile.
+        """
         if self.optimization_worker and self.optimization_worker.isRunning():
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("Cancelling after the current radius...")
+            self.optimization_worker.finished.connect(self.on_analysis_cancelled)
             self.optimization_worker.cancel()
-            self.optimization_worker.wait()
-            
+            return
+        
+        self.on_analysis_cancelled()
+    
+    def on_analysis_cancelled(self):
+        """Reset the UI once a cancelled worker has stopped."""
         self.status_label.setText("Analysis cancelled")
         self.reset_ui_after_analysis()
     
+    def on_csv_saved(self, output_dir: str):
+        """Log that the per-particle CSVs were written (after completion)."""
+        logger.info(f"Analysis CSVs saved to {output_dir}")
+    
+    def on_progress_event(self, event):
+        """Dispatch a ProgressEvent from the optimization worker."""
+        if event.stage is not None:
+            self.update_stage_indicator(event.stage)
+        for result in event.results:
+            self.on_progress_updated(result)
+        if event.percent is not None:
+            self.update_progress_bar(event.percent)
+        if event.text is not None:
+            self.update_status_text(event.text)
+    
     def on_progress_updated(self, result):
         """Handle progress updates from optimization worker.
         
@@ -725,19 +773,29 @@ class ParticleAnalysisGUI(QWidget):
         ]
         
         # Update final results display
-        best_result = summary.get_result_by_radius(summary.best_radius)
-        if best_result:
-            best_metrics = final_metrics_data[summary.results.index(best_result)]
+        # Single scan for the best row's position (its metrics share the index)
+        best_index = next(
+            (i for i, res in enumerate(summary.results) if res.radius == summary.best_radius),
+            None,
+        )
+        if best_index is not None:
+            best_result = summary.results[best_index]
+            best_metrics = final_metrics_data[best_index]
             
             # Get connectivity info
             connectivity = self.connectivity_combo.currentData()
             connectivity_name = CONNECTIVITY_NAMES.get(connectivity, f"{connectivity}-Neighborhood")
             
             # Get output directory info
-            csv_path = self.output_dir / "optimization_results.csv"
-            csv_exists = "✅" if csv_path.exists() else "❌"
-            labels_path = self.output_dir / f"labels_r{summary.best_radius}.npy"
-            labels_exists = "✅" if labels_path.exists() else "❌"
+            # Feather by default; CSV when pyarrow is unavailable
+            table_path = next((p for p in (self.output_dir / "optimization_results.feather",
+                                           self.output_dir / "optimization_results.csv")
+                               if p.exists()), None)
+            table_exists = "✅" if table_path is not None else "❌"
+            table_name = table_path.name if table_path is not None else "optimization_results.feather"
+            labels_path = self._find_labels(summary.best_radius)
+            labels_exists = "✅" if labels_path is not None else "❌"
+            labels_name = labels_path.name if labels_path is not None else f"labels_r{summary.best_radius}.npy/.npz"
             
             # Add largest particle ratio to results
             largest_ratio = getattr(best_result, 'largest_particle_ratio', 0.0)
@@ -754,8 +812,8 @@ class ParticleAnalysisGUI(QWidget):
 🔬 選択理由: Selected via HardConstraint + PeakCount + ContactsRange
 
 📁 保存された結果:
-{csv_exists} CSV: optimization_results.csv
-{labels_exists} Labels: labels_r{summary.best_radius}.npy
+{table_exists} Results: {table_name}
+{labels_exists} Labels: {labels_name}
 📂 保存先: {self.output_dir}
 
 💡 "📊 接触分布"と"📊 体積分布"を確認してください
@@ -764,9 +822,7 @@ class ParticleAnalysisGUI(QWidget):
         
         # Clear and rebuild table with final metrics
         self.results_table.clear_results()
-        for i, result in enumerate(summary.results):
-            is_best = (result.radius == summary.best_radius)
-            self.results_table.add_result(result, final_metrics_data[i], is_best)
+        self.results_table.add_results(summary.results, final_metrics_data, summary.best_radius)
         
         # Plot histograms
         if contact_histogram:
@@ -821,9 +877,12 @@ class ParticleAnalysisGUI(QWidget):
         self.start_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
-        self.optimization_worker = None
+        # Results arrive before the thread returns; keep a running worker
+        # referenced until ``finished`` so a new run cannot start alongside it
+        if not self.is_busy():
+            self.optimization_worker = None
     
-    def on_table_selection_changed(self):
+    def on_table_selection_changed(self, *args):
         """Handle table selection changes."""
         # Optional: Could trigger 3D view updates based on selected radius
         pass
@@ -880,11 +939,11 @@ class ParticleAnalysisGUI(QWidget):
             return
         
         best_r = self.optimization_summary.best_radius
-        best_labels_path = self.output_dir / f"labels_r{best_r}.npy"
-        if best_labels_path.exists():
+        best_labels_path = self._find_labels(best_r)
+        if best_labels_path is not None:
             self.load_best_labels_in_napari(best_labels_path)
         else:
-            QMessageBox.warning(self, "Warning", f"labels_r{best_r}.npy not found.")
+            QMessageBox.warning(self, "Warning", f"labels_r{best_r}.npy/.npz not found.")
     
     def view_3d_results_with_contacts(self):
         """Open 3D viewer with contact count coloring.
@@ -896,10 +955,10 @@ class ParticleAnalysisGUI(QWidget):
             return
         
         best_r = self.optimization_summary.best_radius
-        best_labels_path = self.output_dir / f"labels_r{best_r}.npy"
+        best_labels_path = self._find_labels(best_r)
         
-        if not best_labels_path.exists():
-            QMessageBox.warning(self, "Warning", f"labels_r{best_r}.npy not found.")
+        if best_labels_path is None:
+            QMessageBox.warning(self, "Warning", f"labels_r{best_r}.npy/.npz not found.")
             return
         
         if not check_napari_available(self):
@@ -939,6 +998,13 @@ class ParticleAnalysisGUI(QWidget):
         except Exception as e:
             handle_napari_error(self, e, "contact coloring")
     
+    def _find_labels(self, radius: int) -> Optional[Path]:
+        """Return the saved labels file for *radius* (``.npy`` or compressed ``.npz``), or None."""
+        try:
+            return resolve_labels_path(self.output_dir / f"labels_r{radius}.npy")
+        except FileNotFoundError:
+            return None
+
     def load_3d_results(self, radius: int = None):
         """Load 3D results for specific radius (labels only)."""
         try:
@@ -948,11 +1014,11 @@ class ParticleAnalysisGUI(QWidget):
             
             # Load selected or best radius labels
             selected_radius = radius if radius is not None else self.optimization_summary.best_radius
-            labels_path = self.output_dir / f"labels_r{selected_radius}.npy"
-            if labels_path.exists():
+            labels_path = self._find_labels(selected_radius)
+            if labels_path is not None:
                 self.load_best_labels_in_napari(labels_path)
             else:
-                QMessageBox.warning(self, "Warning", f"labels_r{selected_radius}.npy not found.")
+                QMessageBox.warning(self, "Warning", f"labels_r{selected_radius}.npy/.npz not found.")
             
         except Exception as e:
             QMessageBox.critical(self, "3D Viewer Error", f"Failed to load 3D results:\n\n{str(e)}")
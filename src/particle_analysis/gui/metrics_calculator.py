@@ -14,6 +14,9 @@ logger = logging.getLogger(__name__)
 
 class MetricsCalculator:
     """Calculate various metrics for optimization results."""
+
+    # Column order of the array returned by metrics_to_array
+    METRIC_KEYS = ('hhi', 'knee_dist', 'vi_stability')
     
     @staticmethod
     def calculate_current_metrics(result, temp_results: Optional[List] = None) -> Dict[str, float]:
@@ -198,6 +201,24 @@ class MetricsCalculator:
         
         return metrics
 
+    @staticmethod
+    def metrics_to_array(metrics_data) -> np.ndarray:
+        """Pack per-result metric dictionaries into a single array.
+        
+        Args:
+            metrics_data: List of metric dicts, or an already packed array
+            
+        Returns:
+            Float array of shape (N, 3) with columns hhi, knee_dist, vi_stability
+        """
+        if isinstance(metrics_data, np.ndarray):
+            return metrics_data
+        
+        packed = np.zeros((len(metrics_data), len(MetricsCalculator.METRIC_KEYS)), dtype=np.float64)
+        for i, m in enumerate(metrics_data):
+            packed[i] = (m.get('hhi', 0.0), m.get('knee_dist', 0.0), m.get('vi_stability', 0.0))
+        return packed
+
 
 __all__ = ['MetricsCalculator']
 
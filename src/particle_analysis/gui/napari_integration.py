@@ -10,6 +10,7 @@ from typing import Optional
 
 import numpy as np
 
+from ..utils.common import load_labels
 from .config import (
     NAPARI_VOLUME_OPACITY,
     NAPARI_LABELS_OPACITY,
@@ -120,11 +121,8 @@ class NapariViewerManager:
         if not NAPARI_AVAILABLE:
             raise RuntimeError("Napari is not installed")
         
-        if not best_labels_path.exists():
-            raise FileNotFoundError(f"Labels file not found: {best_labels_path}")
-        
-        # Load data
-        best_labels = np.load(best_labels_path)
+        # Load data (.npy or compressed .npz; raises FileNotFoundError if neither exists)
+        best_labels = load_labels(best_labels_path)
         
         logger.info(f"Opening Napari with best result (r={best_radius})")
         logger.info(f"Labels shape: {best_labels.shape}")
@@ -208,11 +206,8 @@ class NapariViewerManager:
         if not NAPARI_AVAILABLE:
             raise RuntimeError("Napari is not installed")
         
-        if not best_labels_path.exists():
-            raise FileNotFoundError(f"Labels file not found: {best_labels_path}")
-        
-        # Load data
-        best_labels = np.load(best_labels_path)
+        # Load data (.npy or compressed .npz; raises FileNotFoundError if neither exists)
+        best_labels = load_labels(best_labels_path)
         
         logger.info(f"Opening Napari with contact-colored result (r={best_radius})")
         logger.info(f"Labels shape: {best_labels.shape}, unique particles: {best_labels.max()}")
@@ -257,7 +252,7 @@ class NapariViewerManager:
         # ========================================
         logger.info("Creating Layer 2: Guard Volume Boundary...")
         eroded = binary_erosion(guard_mask, iterations=NAPARI_GUARD_SHELL_THICKNESS)
-        boundary_shell = guard_mask.astype(np.uint8) - eroded.astype(np.uint8)
+        boundary_shell = guard_mask & ~eroded
         
         viewer.add_image(
             boundary_shell.astype(np.float32),
@@ -380,21 +375,23 @@ class NapariViewerManager:
         
         # Load labels for each radius
         for r in sorted(radii):
-            labels_path = output_dir / f"labels_r{r}.npy"
+            try:
+                # .npy or compressed .npz, whichever the optimizer wrote
+                labels = load_labels(output_dir / f"labels_r{r}.npy")
+            except FileNotFoundError:
+                logger.warning(f"Labels for r={r} not found; skipping")
+                continue
             
-            if labels_path.exists():
-                labels = np.load(labels_path)
-                
-                # Highlight best radius
-                is_best = (r == best_radius) if best_radius else False
-                layer_name = f"r={r}" + (" ⭐ BEST" if is_best else "")
-                
-                viewer.add_labels(
-                    labels,
-                    name=layer_name,
-                    visible=is_best,  # Only show best by default
-                    opacity=NAPARI_LABELS_OPACITY
-                )
+            # Highlight best radius
+            is_best = (r == best_radius) if best_radius else False
+            layer_name = f"r={r}" + (" ⭐ BEST" if is_best else "")
+            
+            viewer.add_labels(
+                labels,
+                name=layer_name,
+                visible=is_best,  # Only show best by default
+                opacity=NAPARI_LABELS_OPACITY
+            )
         
         # Set optimal view
         viewer.dims.ndisplay = NAPARI_NDISPLAY_3D
@@ -6,9 +6,8 @@ that are called from the main GUI window.
 
 import logging
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from typing import Dict, Tuple
 
-import cv2
 import numpy as np
 
 logger = logging.getLogger(__name__)
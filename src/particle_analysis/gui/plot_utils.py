@@ -9,6 +9,9 @@ from typing import Iterable
 
 import numpy as np
 
+# Integer values below this use a bincount CDF for percentiles instead of a sort
+_HISTOGRAM_PERCENTILE_MAX = 1 << 16
+
 
 def robust_upper_bound(values: Iterable[float], percentile: float, safety: float = 1.05) -> float:
     """Return a robust upper x-limit based on a high percentile with safety margin.
@@ -28,6 +31,41 @@ def robust_upper_bound(values: Iterable[float], percentile: float, safety: float
     return upper * safety
 
 
+def _percentiles_from_counts(arr: np.ndarray, qs) -> np.ndarray:
+    """``np.percentile(arr, qs)`` for small non-negative integers via a histogram CDF.
+
+    The order statistics are read from the cumulative bincount instead of
+    sorting, with the same linear interpolation as NumPy's default method.
+    """
+    cdf = np.cumsum(np.bincount(arr))
+    pos = np.asarray(qs, dtype=np.float64) / 100.0 * (arr.size - 1)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, arr.size - 1)
+    v_lo = np.searchsorted(cdf, lo, side='right')
+    v_hi = np.searchsorted(cdf, hi, side='right')
+    return v_lo + (pos - lo) * (v_hi - v_lo)
+
+
+def robust_summary(values: Iterable[float], percentile: float, safety: float = 1.05):
+    """Return (min, median, robust upper bound, max) from a single percentile pass.
+
+    The upper bound matches ``robust_upper_bound(values, percentile, safety)``.
+    Contact counts and other small non-negative integers skip the sort and use
+    a histogram instead.
+    """
+    arr = np.asarray(values)
+    if arr.size == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    qs = [0.0, 50.0, percentile, 100.0]
+    if arr.dtype.kind in 'iu' and arr.min() >= 0 and arr.max() < _HISTOGRAM_PERCENTILE_MAX:
+        vmin, median, upper, vmax = _percentiles_from_counts(arr.ravel(), qs)
+    else:
+        vmin, median, upper, vmax = np.percentile(arr.astype(np.float64, copy=False), qs)
+    if arr.size <= 10:
+        upper = max(vmax, 0.0)
+    return float(vmin), float(median), float(upper) * safety, float(vmax)
+
+
 def style_dark_axes(ax) -> None:
     ax.set_facecolor('#2c313a')
     for side in ('bottom', 'top', 'left', 'right'):
@@ -49,6 +87,7 @@ def set_legend_white(legend) -> None:
 
 __all__ = [
     'robust_upper_bound',
+    'robust_summary',
     'style_dark_axes',
     'set_legend_white',
 ]
@@ -9,13 +9,24 @@ All functions are free of Qt/GUI dependencies and can be tested independently.
 """
 
 import csv
+import io
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, Optional, Set
 
 import numpy as np
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional: multithreaded CSV encoder
+    pa = None
+    pacsv = None
+
+from ..contact.guard_volume import count_contacts_with_guard
+from ..utils.common import load_labels
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,7 +71,7 @@ def analyze_best_labels(
     """Load labels and compute contacts/volumes for interior particles.
 
     Args:
-        labels_path: Path to ``labels_r{best}.npy``
+        labels_path: Path to ``labels_r{best}.npy`` (a ``.npz`` sibling is also accepted)
         connectivity: Neighbourhood connectivity (6 or 26)
 
     Returns:
@@ -70,27 +81,32 @@ def analyze_best_labels(
         FileNotFoundError: if *labels_path* does not exist
         ValueError: if no particles are found
     """
-    from ..volume.metrics.basic import calculate_particle_volumes
-    from ..contact.guard_volume import count_contacts_with_guard
-
-    if not labels_path.exists():
-        raise FileNotFoundError(f"Labels not found: {labels_path}")
-
-    labels = np.load(labels_path)
-    logger.info(f"Loaded labels: {labels.shape}, {labels.max()} particles")
-
-    # Volumes for ALL particles
-    all_volumes = calculate_particle_volumes(labels)
-    if not all_volumes:
+    # Only read-only reductions follow, so page the volume in on demand
+    labels = load_labels(labels_path, mmap_mode='r')
+
+    # Voxel counts for ALL particles in one pass; shared with the guard-margin
+    # computation so the volume is scanned only once for sizes
+    flat = labels.ravel()
+    if flat.dtype.kind == 'i' and flat.size and flat.min() < 0:
+        flat = flat[flat > 0]
+    label_counts = np.bincount(flat) if flat.size else np.zeros(1, dtype=np.intp)
+    max_label = len(label_counts) - 1
+    if max_label == 0:
         raise ValueError("No particles found in labels")
+    logger.info(f"Loaded labels: {labels.shape}, {max_label} particles")
+
+    # Older label files may be int64; the contact kernel and guard filter scan
+    # the volume several times, so narrow it once (the max is already known)
+    if labels.dtype.itemsize > 4 and max_label <= np.iinfo(np.int32).max:
+        labels = labels.astype(np.int32)
 
     # Contacts with guard-volume filtering
     _full, interior_contacts, guard_stats = count_contacts_with_guard(
-        labels, connectivity=connectivity
+        labels, connectivity=connectivity, label_counts=label_counts
     )
 
-    interior_ids = set(interior_contacts.keys())
-    interior_volumes = {pid: all_volumes[pid] for pid in interior_ids if pid in all_volumes}
+    interior_volumes = {pid: int(label_counts[pid]) for pid in interior_contacts
+                        if label_counts[pid] > 0}
 
     logger.info(
         f"Interior analysis complete: {len(interior_contacts)} interior, "
@@ -104,56 +120,90 @@ def analyze_best_labels(
     )
 
 
+def save_analysis_cache(path: Path, analysis: InteriorAnalysis) -> None:
+    """Persist an :class:`InteriorAnalysis` as arrays in an ``.npz`` file."""
+    contact_ids = np.fromiter(analysis.interior_contacts.keys(), dtype=np.int64,
+                              count=len(analysis.interior_contacts))
+    contact_vals = np.fromiter(analysis.interior_contacts.values(), dtype=np.int64,
+                               count=len(analysis.interior_contacts))
+    volume_ids = np.fromiter(analysis.interior_volumes.keys(), dtype=np.int64,
+                             count=len(analysis.interior_volumes))
+    volume_vals = np.fromiter(analysis.interior_volumes.values(), dtype=np.int64,
+                              count=len(analysis.interior_volumes))
+    stats = analysis.guard_stats
+    np.savez_compressed(
+        path,
+        contact_ids=contact_ids,
+        contact_counts=contact_vals,
+        volume_ids=volume_ids,
+        volumes=volume_vals,
+        guard_stats=np.array([stats.get('total_particles', 0),
+                              stats.get('interior_particles', 0),
+                              stats.get('excluded_particles', 0)], dtype=np.int64),
+    )
+
+
+def load_analysis_cache(path: Path) -> InteriorAnalysis:
+    """Load an :class:`InteriorAnalysis` written by :func:`save_analysis_cache`."""
+    with np.load(path) as f:
+        total, interior, excluded = f['guard_stats'].tolist()
+        return InteriorAnalysis(
+            interior_contacts=dict(zip(f['contact_ids'].tolist(), f['contact_counts'].tolist())),
+            interior_volumes=dict(zip(f['volume_ids'].tolist(), f['volumes'].tolist())),
+            guard_stats={
+                'total_particles': total,
+                'interior_particles': interior,
+                'excluded_particles': excluded,
+            },
+        )
+
+
 # ---------------------------------------------------------------------------
 # 2. Build histogram / scatter dicts (consumed by HistogramPlotter)
 # ---------------------------------------------------------------------------
 
-def build_contact_histogram(analysis: InteriorAnalysis) -> Optional[Dict]:
-    """Build contact-histogram dict expected by ``HistogramPlotter``."""
-    values = list(analysis.interior_contacts.values())
-    if not values:
+def _histogram_dict(per_particle: Dict[int, int], analysis: InteriorAnalysis) -> Optional[Dict]:
+    """Pack per-particle values into one array and summarise it."""
+    if not per_particle:
         return None
+    values = np.fromiter(per_particle.values(), dtype=np.int64, count=len(per_particle))
     return {
         'values': values,
-        'min': int(np.min(values)),
-        'max': int(np.max(values)),
-        'mean': float(np.mean(values)),
+        'min': int(values.min()),
+        'max': int(values.max()),
+        'mean': float(values.mean()),
         'median': float(np.median(values)),
         'interior_count': analysis.interior_count,
         'excluded_count': analysis.excluded_count,
     }
 
 
+def build_contact_histogram(analysis: InteriorAnalysis) -> Optional[Dict]:
+    """Build contact-histogram dict expected by ``HistogramPlotter``."""
+    return _histogram_dict(analysis.interior_contacts, analysis)
+
+
 def build_volume_histogram(analysis: InteriorAnalysis) -> Optional[Dict]:
     """Build volume-histogram dict expected by ``HistogramPlotter``."""
-    values = list(analysis.interior_volumes.values())
-    if not values:
-        return None
-    return {
-        'values': values,
-        'min': int(np.min(values)),
-        'max': int(np.max(values)),
-        'mean': float(np.mean(values)),
-        'median': float(np.median(values)),
-        'interior_count': analysis.interior_count,
-        'excluded_count': analysis.excluded_count,
-    }
+    return _histogram_dict(analysis.interior_volumes, analysis)
 
 
 def build_scatter_data(analysis: InteriorAnalysis) -> Optional[Dict]:
-    """Build scatter dict expected by ``HistogramPlotter``."""
-    ids, vols, conts = [], [], []
-    for pid in analysis.interior_ids:
-        if pid in analysis.interior_volumes and pid in analysis.interior_contacts:
-            ids.append(pid)
-            vols.append(analysis.interior_volumes[pid])
-            conts.append(analysis.interior_contacts[pid])
-
-    if not ids:
+    """Build scatter dict expected by ``HistogramPlotter``.
+
+    ``particle_ids``, ``volumes`` and ``contacts`` are aligned int64 arrays in
+    ascending particle-id order.
+    """
+    contacts = analysis.interior_contacts
+    volumes = analysis.interior_volumes
+    ids = np.array(sorted(contacts.keys() & volumes.keys()), dtype=np.int64)
+    if not ids.size:
         return None
+
+    id_list = ids.tolist()
     return {
-        'volumes': vols,
-        'contacts': conts,
+        'volumes': np.fromiter((volumes[pid] for pid in id_list), dtype=np.int64, count=ids.size),
+        'contacts': np.fromiter((contacts[pid] for pid in id_list), dtype=np.int64, count=ids.size),
         'particle_ids': ids,
         'interior_count': analysis.interior_count,
         'excluded_count': analysis.excluded_count,
@@ -164,14 +214,37 @@ def build_scatter_data(analysis: InteriorAnalysis) -> Optional[Dict]:
 # 3. CSV export
 # ---------------------------------------------------------------------------
 
-def _write_csv(path: Path, comment_lines: list[str], header: list[str], rows):
-    """Write a CSV with ``#``-prefixed comment lines, a header row, and data rows."""
+def _write_csv(path: Path, comment_lines: list[str], columns: Dict[str, np.ndarray]):
+    """Write a CSV with ``#``-prefixed comment lines, a header row, and data columns.
+
+    Uses PyArrow's CSV writer when available; otherwise the whole file is
+    formatted in memory with :mod:`csv` and written with a single call.
+    """
+    preamble = "".join(f"# {line}\n" for line in comment_lines)
+    preamble += ",".join(columns) + "\n"
+    if pacsv is not None:
+        with open(path, "wb") as f:
+            f.write(preamble.encode("utf-8"))
+            pacsv.write_csv(
+                pa.table(columns), f,
+                write_options=pacsv.WriteOptions(include_header=False, quoting_style="none"),
+            )
+        return
+
+    buf = io.StringIO()
+    buf.write(preamble)
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerows(zip(*(np.asarray(col).tolist() for col in columns.values())))
     with open(path, "w", newline="", encoding="utf-8") as f:
-        for line in comment_lines:
-            f.write(f"# {line}\n")
-        writer = csv.writer(f)
-        writer.writerow(header)
-        writer.writerows(rows)
+        f.write(buf.getvalue())
+
+
+def _sorted_columns(per_particle: Dict[int, int], value_name: str) -> Dict[str, np.ndarray]:
+    """Return ``particle_id`` and *value_name* columns in ascending id order."""
+    ids = np.fromiter(per_particle.keys(), dtype=np.int64, count=len(per_particle))
+    vals = np.fromiter(per_particle.values(), dtype=np.int64, count=len(per_particle))
+    order = np.argsort(ids, kind="stable")
+    return {"particle_id": ids[order], value_name: vals[order]}
 
 
 def save_analysis_csvs(output_dir: Path, analysis: InteriorAnalysis) -> None:
@@ -187,9 +260,10 @@ def save_analysis_csvs(output_dir: Path, analysis: InteriorAnalysis) -> None:
 
     # --- contact_distribution.csv ---
     try:
-        vals = list(analysis.interior_contacts.values())
-        mean_c = float(np.mean(vals)) if vals else 0.0
-        median_c = float(np.median(vals)) if vals else 0.0
+        columns = _sorted_columns(analysis.interior_contacts, "contact_count")
+        vals = columns["contact_count"]
+        mean_c = float(vals.mean()) if vals.size else 0.0
+        median_c = float(np.median(vals)) if vals.size else 0.0
         _write_csv(
             output_dir / "contact_distribution.csv",
             [
@@ -197,9 +271,7 @@ def save_analysis_csvs(output_dir: Path, analysis: InteriorAnalysis) -> None:
                 f"interior_particles={ic}, excluded_boundary={ec}",
                 f"mean={mean_c:.4f}, median={median_c:.1f}",
             ],
-            ["particle_id", "contact_count"],
-            [[pid, analysis.interior_contacts[pid]]
-             for pid in sorted(analysis.interior_contacts)],
+            columns,
         )
         logger.info(f"Saved contact_distribution.csv ({len(vals)} rows)")
     except Exception as e:
@@ -207,9 +279,10 @@ def save_analysis_csvs(output_dir: Path, analysis: InteriorAnalysis) -> None:
 
     # --- volume_distribution.csv ---
     try:
-        vals = list(analysis.interior_volumes.values())
-        mean_v = float(np.mean(vals)) if vals else 0.0
-        median_v = float(np.median(vals)) if vals else 0.0
+        columns = _sorted_columns(analysis.interior_volumes, "volume_voxels")
+        vals = columns["volume_voxels"]
+        mean_v = float(vals.mean()) if vals.size else 0.0
+        median_v = float(np.median(vals)) if vals.size else 0.0
         _write_csv(
             output_dir / "volume_distribution.csv",
             [
@@ -217,9 +290,7 @@ def save_analysis_csvs(output_dir: Path, analysis: InteriorAnalysis) -> None:
                 f"interior_particles={ic}, excluded_boundary={ec}",
                 f"mean={mean_v:.2f}, median={median_v:.1f} (voxels)",
             ],
-            ["particle_id", "volume_voxels"],
-            [[pid, analysis.interior_volumes[pid]]
-             for pid in sorted(analysis.interior_volumes)],
+            columns,
         )
         logger.info(f"Saved volume_distribution.csv ({len(vals)} rows)")
     except Exception as e:
@@ -228,9 +299,9 @@ def save_analysis_csvs(output_dir: Path, analysis: InteriorAnalysis) -> None:
     # --- volume_vs_contacts.csv ---
     try:
         scatter = build_scatter_data(analysis)
-        if scatter and scatter['particle_ids']:
-            vols = np.array(scatter['volumes'])
-            conts = np.array(scatter['contacts'])
+        if scatter:
+            vols = scatter['volumes']
+            conts = scatter['contacts']
             ids = scatter['particle_ids']
 
             slope, corr = 0.0, 0.0
@@ -246,8 +317,7 @@ def save_analysis_csvs(output_dir: Path, analysis: InteriorAnalysis) -> None:
                     f"interior_particles={ic}, excluded_boundary={ec}",
                     f"linear_fit_slope={slope:.6f}, correlation_R={corr:.4f}",
                 ],
-                ["particle_id", "volume_voxels", "contact_count"],
-                sorted(zip(ids, [int(v) for v in vols], [int(c) for c in conts])),
+                {"particle_id": ids, "volume_voxels": vols, "contact_count": conts},
             )
             logger.info(f"Saved volume_vs_contacts.csv ({len(ids)} rows)")
         else:
@@ -259,6 +329,8 @@ def save_analysis_csvs(output_dir: Path, analysis: InteriorAnalysis) -> None:
 __all__ = [
     "InteriorAnalysis",
     "analyze_best_labels",
+    "save_analysis_cache",
+    "load_analysis_cache",
     "build_contact_histogram",
     "build_volume_histogram",
     "build_scatter_data",
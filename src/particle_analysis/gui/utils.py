@@ -5,7 +5,7 @@ error handling, logging setup, and common UI helpers.
 """
 
 import logging
-from typing import Optional, Callable
+from typing import Callable
 from functools import wraps
 
 from qtpy.QtWidgets import QMessageBox
@@ -4,21 +4,54 @@ This module contains specialized Qt widgets for displaying optimization
 results in tabular and graphical formats, plus research-oriented histogram plots.
 """
 
+import hashlib
 import logging
+import operator
 from typing import List, Dict, Optional
 
 import numpy as np
-from qtpy.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QLabel
+from qtpy.QtWidgets import QWidget, QVBoxLayout, QTableView, QAbstractItemView
 from qtpy.QtWidgets import QHeaderView
-from qtpy.QtCore import Qt
-from qtpy.QtGui import QColor
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from .plot_utils import robust_upper_bound, style_dark_axes, set_legend_white
+from qtpy.QtCore import Qt, QAbstractTableModel, QModelIndex
+from qtpy.QtGui import QColor, QFont
+from .plot_utils import robust_summary, style_dark_axes, set_legend_white
+from .metrics_calculator import MetricsCalculator
 
 logger = logging.getLogger(__name__)
 
 
+_get_largest_ratio = operator.attrgetter('largest_particle_ratio')
+
+
+def _largest_ratio(result) -> float:
+    """Return result.largest_particle_ratio, or 0.0 if the result lacks it."""
+    try:
+        return _get_largest_ratio(result)
+    except AttributeError:
+        return 0.0
+
+
+def _digest(*arrays: np.ndarray) -> bytes:
+    """BLAKE2b digest of the arrays' dtypes, shapes and bytes (plotted-content key)."""
+    h = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr)
+        h.update(f"{arr.dtype.str}{arr.shape}".encode())
+        h.update(arr.tobytes())
+    return h.digest()
+
+
+def _import_mpl_qt():
+    """Import the matplotlib Figure and Qt canvas classes on first use.
+
+    Deferred so that importing this module (and opening the main window)
+    does not pay for matplotlib until a plot widget is actually created.
+    """
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+    from matplotlib.figure import Figure
+    return Figure, FigureCanvasQTAgg
+
+
 class MplWidget(QWidget):
     """Simple Matplotlib canvas widget for embedding plots in Qt.
     
@@ -28,6 +61,9 @@ class MplWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._dirty = False
+        self._ax = None
+        self._plot_key = None  # fingerprint of the data currently plotted
         self.setup_canvas()
     
     def setup_canvas(self):
@@ -36,7 +72,8 @@ class MplWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Create matplotlib figure
-        self.figure = Figure(figsize=(8, 6), facecolor='#2c313a')
+        Figure, FigureCanvas = _import_mpl_qt()
+        self.figure = Figure(figsize=(8, 6), facecolor='#2c313a', layout='constrained')
         self.canvas = FigureCanvas(self.figure)
         
         # Apply dark theme
@@ -46,27 +83,160 @@ class MplWidget(QWidget):
         self.setLayout(layout)
     
     def clear(self):
-        """Clear the figure."""
-        self.figure.clear()
-        self.canvas.draw()
+        """Clear the figure, keeping the cached axes for reuse.
+
+        ``cla()`` resets the axes to matplotlib's light default style, so the
+        axes stays hidden (an empty dark canvas) until the next plot.
+        """
+        self._plot_key = None
+        if self._ax is not None:
+            self._ax.cla()
+            self._ax.set_visible(False)
+        else:
+            self.figure.clear()
+        self.request_draw()
+
+    def get_axes(self):
+        """Return the single plot axes, creating it on first use."""
+        if self._ax is None:
+            self._ax = self.figure.add_subplot(111)
+        self._ax.set_visible(True)
+        return self._ax
+
+    def request_draw(self):
+        """Schedule a redraw, deferring it until the widget is shown if hidden."""
+        if self.canvas.isVisible():
+            self.canvas.draw_idle()
+        else:
+            self._dirty = True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self.canvas.draw()
+
+
+class ResultsModel(QAbstractTableModel):
+    """Table model holding one row per optimization result.
+
+    Rows are stored as tuples of display strings, formatted once per batch
+    with vectorized NumPy string formatting when results are appended.
+    """
+
+    HEADERS = [
+        "ｒ値", "粒子数", "平均接触数", "最大粒子割合(%)",
+        "処理時間(秒)", "ステータス"
+    ]
+
+    # Shared styling for the optimal row
+    _GOLD = QColor(255, 215, 0)
+    _STATUS_BEST = "★ OPTIMAL"
+    _STATUS_COMPUTED = "Computed"
+    _bold_font: Optional[QFont] = None  # created on first use (needs a QApplication)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[tuple] = []
+        self._best_row: int = -1
 
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
 
-class ResultsTable(QTableWidget):
-    """Table widget for displaying optimization results."""
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            if col == 5:
+                return self._STATUS_BEST if row == self._best_row else self._STATUS_COMPUTED
+            return self._rows[row][col]
+        if row == self._best_row:
+            if role == Qt.BackgroundRole:
+                return self._GOLD
+            if role == Qt.FontRole:
+                return self._get_bold_font()
+        return None
+
+    @classmethod
+    def _get_bold_font(cls) -> QFont:
+        """Return the shared bold font, creating it once."""
+        if cls._bold_font is None:
+            font = QFont()
+            font.setBold(True)
+            cls._bold_font = font
+        return cls._bold_font
+
+    def append_row(self, result, is_best: bool = False) -> None:
+        """Append one result row."""
+        self.append_rows([result], result.radius if is_best else None)
+
+    def append_rows(self, results: List, best_radius: Optional[int] = None) -> None:
+        """Append several result rows with a single insert notification."""
+        if not results:
+            return
+        n, count = len(self._rows), len(results)
+        radii = np.fromiter((r.radius for r in results), dtype=np.int64, count=count)
+        particle_counts = np.fromiter((r.particle_count for r in results), dtype=np.int64, count=count)
+        mean_contacts = np.fromiter((r.mean_contacts for r in results), dtype=np.float64, count=count)
+        largest_ratios = np.fromiter((_largest_ratio(r) for r in results), dtype=np.float64, count=count)
+        times = np.fromiter((r.processing_time for r in results), dtype=np.float64, count=count)
+
+        # Format each column in one C loop rather than per cell
+        columns = (
+            radii.astype(str),
+            particle_counts.astype(str),
+            np.char.mod('%.1f', mean_contacts),
+            np.char.mod('%.1f', largest_ratios * 100),  # Convert to percentage
+            np.char.mod('%.1f', times),
+        )
+
+        self.beginInsertRows(QModelIndex(), n, n + count - 1)
+        self._rows.extend(zip(*(c.tolist() for c in columns)))
+        self.endInsertRows()
+
+        if best_radius is not None:
+            hits = np.flatnonzero(radii == best_radius)
+            if hits.size:
+                self.set_best_row(n + int(hits[-1]))
+
+    def set_best_row(self, new_row: int) -> None:
+        """Move the optimal-row highlight, repainting only the rows it touches."""
+        old_row, self._best_row = self._best_row, new_row
+        # Status text, background and font all depend on the best row
+        roles = [Qt.DisplayRole, Qt.BackgroundRole, Qt.FontRole]
+        last_col = len(self.HEADERS) - 1
+        for row in {old_row, new_row}:
+            if 0 <= row < len(self._rows):
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_col), roles)
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.beginResetModel()
+        self._rows.clear()
+        self._best_row = -1
+        self.endResetModel()
+
+
+class ResultsTable(QTableView):
+    """Table view for displaying optimization results."""
     
     def __init__(self):
         super().__init__()
+        self.results_model = ResultsModel(self)
+        self.setModel(self.results_model)
         self.setup_table()
     
     def setup_table(self):
         """Setup table headers and formatting."""
-        headers = [
-            "ｒ値", "粒子数", "平均接触数", "最大粒子割合(%)",
-            "処理時間(秒)", "ステータス"
-        ]
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
-        
         # Header resize policy: important columns fit contents, Status fixed
         header = self.horizontalHeader()
         # Make all columns comfortably wide by default; allow user resize interactively
@@ -89,61 +259,109 @@ class ResultsTable(QTableWidget):
         self.setColumnWidth(5, default_w)  # Status
         
         # Enable selection
-        self.setSelectionBehavior(QTableWidget.SelectRows)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.setAlternatingRowColors(True)
     
     def add_result(self, result, new_metrics: Dict = None, is_best: bool = False):
         """Add a new result row to the table."""
-        row = self.rowCount()
-        self.insertRow(row)
-        
-        # Get largest_particle_ratio (default to 0.0 if not available)
-        largest_ratio = getattr(result, 'largest_particle_ratio', 0.0)
-        
-        # Add data
-        self.setItem(row, 0, QTableWidgetItem(str(result.radius)))
-        self.setItem(row, 1, QTableWidgetItem(str(result.particle_count)))
-        self.setItem(row, 2, QTableWidgetItem(f"{result.mean_contacts:.1f}"))
-        self.setItem(row, 3, QTableWidgetItem(f"{largest_ratio * 100:.1f}"))  # Convert to percentage
-        self.setItem(row, 4, QTableWidgetItem(f"{result.processing_time:.1f}"))
-        
-        # Status (now last column)
-        if is_best:
-            self.setItem(row, 5, QTableWidgetItem("★ OPTIMAL"))
-        else:
-            self.setItem(row, 5, QTableWidgetItem("Computed"))
-        
-        # Highlight best result
-        if is_best:
-            for col in range(self.columnCount()):
-                item = self.item(row, col)
-                if item:
-                    item.setBackground(QColor(255, 215, 0))  # Gold
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
+        self.results_model.append_row(result, is_best)
+
+    def add_results(self, results: List, new_metrics: List[Dict] = None, best_radius: int = None):
+        """Add many result rows at once, repainting the view a single time."""
+        self.setUpdatesEnabled(False)
+        sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        try:
+            self.results_model.append_rows(results, best_radius)
+        finally:
+            self.setSortingEnabled(sorting)
+            self.setUpdatesEnabled(True)
     
     def clear_results(self):
         """Clear all results from the table."""
-        self.setRowCount(0)
+        self.results_model.clear()
 
 
 class ResultsPlotter(QWidget):
     """Widget for plotting optimization results."""
-    
+
+    # Column layout of the per-result cache read by update_plots
+    _COLUMNS_DTYPE = np.dtype([
+        ('radius', 'i4'),
+        ('particle_count', 'i4'),
+        ('mean_contacts', 'f4'),
+        ('largest_particle_ratio', 'f4'),
+    ])
+
+    # Pareto scatter point styles (RGBA with alpha baked in)
+    _BEST_RGBA = np.array([1.0, 0.0, 0.0, 0.7])
+    _OTHER_RGBA = np.array([0.0, 0.0, 1.0, 0.7])
+
     def __init__(self):
         super().__init__()
-        self.setup_plots()
+        self._dirty = False
         self.results_data = []
-    
+        # Structure-of-arrays mirror of results_data, read by update_plots
+        self._columns = np.empty(0, dtype=self._COLUMNS_DTYPE)
+        self._n = 0
+        self._reset_overlay()
+        self.setup_plots()
+
+    def _reset_overlay(self) -> None:
+        """Forget the plotted data and the blit state tied to it."""
+        self._plotted_key = None
+        self._series = ()
+        self._background = None
+        self._best_markers = []
+        self._best_legends = []
+        self._pareto_scatter = None
+        self._best_label = None
+
+    def _rebuild_cache(self, results_data: List) -> np.ndarray:
+        """Mirror the scalars of *results_data* into the column cache and return it.
+
+        The list may have been edited in place, so every row is re-read: one
+        ``np.fromiter`` per column (there is one row per radius).
+        """
+        n = len(results_data)
+        columns = np.empty(n, dtype=self._COLUMNS_DTYPE)
+        columns['radius'][:n] = np.fromiter(
+            (r.radius for r in results_data), dtype=np.int32, count=n)
+        columns['particle_count'][:n] = np.fromiter(
+            (r.particle_count for r in results_data), dtype=np.int32, count=n)
+        columns['mean_contacts'][:n] = np.fromiter(
+            (r.mean_contacts for r in results_data), dtype=np.float32, count=n)
+        columns['largest_particle_ratio'][:n] = np.fromiter(
+            (_largest_ratio(r) for r in results_data),
+            dtype=np.float32, count=n)
+        self.results_data = results_data
+        self._columns = columns
+        self._n = n
+        return columns
+
+    def request_draw(self):
+        """Schedule a redraw, deferring it until the widget is shown if hidden."""
+        if self.canvas.isVisible():
+            self.canvas.draw_idle()
+        else:
+            self._dirty = True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self.canvas.draw()
+
     def setup_plots(self):
         """Setup matplotlib plots."""
         layout = QVBoxLayout(self)
         
         # Create figure with subplots (wider for 2x3 grid)
-        self.figure = Figure(figsize=(15, 8))
+        Figure, FigureCanvas = _import_mpl_qt()
+        self.figure = Figure(figsize=(15, 8), layout='constrained')
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         
         # Create subplots (2x3 grid to accommodate Mean Contacts)
         self.ax1 = self.figure.add_subplot(2, 3, 1)
@@ -152,15 +370,20 @@ class ResultsPlotter(QWidget):
         self.ax4 = self.figure.add_subplot(2, 3, 4)
         self.ax5 = self.figure.add_subplot(2, 3, 5)
         
-        self.figure.tight_layout(pad=3.0)
-        
-        # Initialize plots
-        self.clear_plots()
+        # Initialize plots (first draw happens when data arrives or on show)
+        self._clear_axes()
+        self._dirty = True
     
     def clear_plots(self):
-        """Clear all plots."""
+        """Clear all plots and redraw the empty axes."""
+        self._clear_axes()
+        self.request_draw()
+
+    def _clear_axes(self):
+        """Reset all axes to their empty, labelled state without drawing."""
         for ax in [self.ax1, self.ax2, self.ax3, self.ax4, self.ax5]:
             ax.clear()
+        self._reset_overlay()
         
         # New plots based on Pareto+distance method
         self.ax1.set_title("HHI Dominance Index vs Radius")
@@ -195,96 +418,184 @@ class ResultsPlotter(QWidget):
         self.ax5.set_xlabel("HHI Dominance")
         self.ax5.set_ylabel("Knee Distance")
         self.ax5.grid(True, alpha=0.3)
-        
-        self.canvas.draw()
     
     def update_plots(self, results_data: List, best_radius: int = None, new_metrics_data: List[Dict] = None):
         """Update plots with new data using Pareto+distance indicators."""
         if not results_data:
             return
         
-        self.results_data = results_data
-        
-        # Extract basic data
-        radii = [r.radius for r in results_data]
-        particle_counts = [r.particle_count for r in results_data]
-        
+        # Extract basic data (NumPy views into the column cache)
+        columns = self._rebuild_cache(results_data)
+        radii = columns['radius']
+        particle_counts = columns['particle_count']
+
         # Calculate new metrics if not provided
         if new_metrics_data is None:
             new_metrics_data = self._calculate_new_metrics(results_data)
         
         # Extract new metric values
-        hhi_values = [m.get('hhi', 0.0) for m in new_metrics_data]
-        knee_distances = [m.get('knee_dist', 0.0) for m in new_metrics_data]
-        vi_values = [m.get('vi_stability', 0.0) for m in new_metrics_data]
+        metrics = MetricsCalculator.metrics_to_array(new_metrics_data)
+
+        # Same plotted content, only the optimum changed: move the overlay
+        # artists and blit
+        data_key = _digest(columns, metrics)
+        if data_key == self._plotted_key and self._background is not None:
+            self._update_best_overlay(best_radius)
+            return
+        hhi_values, knee_distances, vi_values = metrics[:, 0], metrics[:, 1], metrics[:, 2]
+        mean_contacts = columns['mean_contacts']
         
         # Clear and plot
-        self.clear_plots()
+        self._clear_axes()
+        self._plotted_key = data_key
+        self._series = (hhi_values, knee_distances, vi_values, mean_contacts)
         
         # Plot 1: HHI Dominance
         self.ax1.plot(radii, hhi_values, 'bo-', linewidth=2, markersize=6, label='HHI Index')
-        if best_radius:
-            best_idx = next((i for i, r in enumerate(results_data) if r.radius == best_radius), None)
-            if best_idx is not None:
-                self.ax1.plot(best_radius, hhi_values[best_idx], 'ro', markersize=12, 
-                             label=f'★ Optimal (r={best_radius})')
-        self.ax1.legend()
         
         # Plot 2: Knee Distance
         self.ax2.plot(radii, knee_distances, 'go-', linewidth=2, markersize=6, label='Knee Distance')
-        if best_radius:
-            best_idx = next((i for i, r in enumerate(results_data) if r.radius == best_radius), None)
-            if best_idx is not None:
-                self.ax2.plot(best_radius, knee_distances[best_idx], 'ro', markersize=12)
-        self.ax2.legend()
         
         # Plot 3: VI Stability
         self.ax3.plot(radii, vi_values, 'mo-', linewidth=2, markersize=6, label='VI Stability')
-        if best_radius:
-            best_idx = next((i for i, r in enumerate(results_data) if r.radius == best_radius), None)
-            if best_idx is not None:
-                self.ax3.plot(best_radius, vi_values[best_idx], 'ro', markersize=12)
-        self.ax3.legend()
         
         # Plot 4: Mean Contacts
-        mean_contacts = [r.mean_contacts for r in results_data]
         self.ax4.plot(radii, mean_contacts, 'co-', linewidth=2, markersize=6, label='Mean Contacts')
-        if best_radius:
-            best_idx = next((i for i, r in enumerate(results_data) if r.radius == best_radius), None)
-            if best_idx is not None:
-                self.ax4.plot(best_radius, mean_contacts[best_idx], 'ro', markersize=12, 
-                             label=f'★ Optimal ({mean_contacts[best_idx]:.1f})')
-        self.ax4.legend()
         
-        # Plot 5: Pareto Frontier (2D projection)
-        colors = ['red' if radii[i] == best_radius else 'blue' for i in range(len(radii))]
-        sizes = [120 if radii[i] == best_radius else 50 for i in range(len(radii))]
-        scatter = self.ax5.scatter(hhi_values, knee_distances, c=colors, s=sizes, alpha=0.7)
-        
-        # Add radius labels
-        for i, r in enumerate(radii):
-            self.ax5.annotate(f'r{r}', (hhi_values[i], knee_distances[i]), 
-                            xytext=(5, 5), textcoords='offset points', fontsize=8)
+        # Optimal-radius markers are animated: they are left out of the cached
+        # background and redrawn on top of it whenever the optimum moves
+        # The legends of ax1/ax4 list the optimum, so they are animated as well
+        self._best_markers = []
+        for ax in (self.ax1, self.ax2, self.ax3, self.ax4):
+            marker, = ax.plot([], [], 'ro', markersize=12, animated=True)
+            self._best_markers.append(marker)
+        for ax in (self.ax2, self.ax3):
+            ax.legend()
         
+        # Plot 5: Pareto Frontier (2D projection)
+        self._pareto_scatter = self.ax5.scatter(hhi_values, knee_distances, animated=True)
+        self.ax5.title.set_animated(True)
+        
+        # Add radius labels (one shared 5pt offset transform; with many radii
+        # only the endpoints are labelled here and the optimum gets its own
+        # animated label)
+        from matplotlib.transforms import offset_copy
+        label_offset = offset_copy(self.ax5.transData, fig=self.figure, x=5, y=5, units='points')
+        label_idx = (0, len(radii) - 1) if len(radii) > 20 else range(len(radii))
+        for i in sorted(set(label_idx)):
+            self.ax5.text(hhi_values[i], knee_distances[i], f'r{radii[i]}',
+                          transform=label_offset, fontsize=8)
+        self._best_label = self.ax5.text(0, 0, '', transform=label_offset, fontsize=8,
+                                         animated=True)
+        
+        self._set_best_overlay(best_radius)
+        
+        # Draw (constrained layout is resolved at draw time)
+        self.request_draw()
+
+    def _set_best_overlay(self, best_radius: Optional[int]) -> None:
+        """Point the animated overlay artists at *best_radius* (no drawing)."""
+        radii = self._columns['radius'][:self._n]
+        best_idx = None
+        if best_radius:
+            hits = np.flatnonzero(radii == best_radius)
+            if hits.size:
+                best_idx = int(hits[0])
+
+        for marker, values in zip(self._best_markers, self._series):
+            if best_idx is None:
+                marker.set_data([], [])
+            else:
+                marker.set_data([best_radius], [values[best_idx]])
+
+        # Legend entries for the optimum (hidden with a leading underscore)
+        if best_idx is None:
+            labels = ('_optimal', '_optimal')
+        else:
+            labels = (f'★ Optimal (r={best_radius})',
+                      f'★ Optimal ({self._series[3][best_idx]:.1f})')
+        self._best_legends = []
+        for ax, marker, label in ((self.ax1, self._best_markers[0], labels[0]),
+                                  (self.ax4, self._best_markers[3], labels[1])):
+            marker.set_label(label)
+            legend = ax.legend()
+            legend.set_animated(True)
+            self._best_legends.append(legend)
+
+        is_best = radii == best_radius
+        self._pareto_scatter.set_facecolors(np.where(is_best[:, None], self._BEST_RGBA, self._OTHER_RGBA))
+        self._pareto_scatter.set_sizes(np.where(is_best, 120, 50))
+
+        hhi_values, knee_distances = self._series[0], self._series[1]
+        if best_idx is not None and len(radii) > 20 and 0 < best_idx < len(radii) - 1:
+            self._best_label.set_position((hhi_values[best_idx], knee_distances[best_idx]))
+            self._best_label.set_text(f'r{best_radius}')
+        else:
+            self._best_label.set_text('')
+
         if best_radius:
             self.ax5.set_title(f"Pareto Frontier (★ Optimal: r={best_radius})")
-        
-        # Update layout and draw
-        self.figure.tight_layout(pad=3.0)
-        self.canvas.draw()
+        else:
+            self.ax5.set_title("Pareto Frontier (3D Objectives)")
+
+    def _update_best_overlay(self, best_radius: Optional[int]) -> None:
+        """Move the optimum overlay and blit it over the cached background."""
+        self._set_best_overlay(best_radius)
+        if not self.canvas.isVisible():
+            self._dirty = True
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+
+    def _animated_artists(self) -> List:
+        if self._pareto_scatter is None:
+            return []
+        return [*self._best_markers, *self._best_legends, self._pareto_scatter,
+                self._best_label, self.ax5.title]
+
+    def _draw_animated(self) -> None:
+        for artist in self._animated_artists():
+            self.figure.draw_artist(artist)
+
+    def _on_draw(self, event) -> None:
+        """Cache the static background after a full draw, then add the overlay."""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
     
     def _calculate_new_metrics(self, results_data: List) -> List[Dict]:
         """Calculate metrics for plot visualization."""
-        from .metrics_calculator import MetricsCalculator
-        
         try:
             return MetricsCalculator.calculate_metrics_for_plots(results_data)
         except Exception as e:
             logger.warning(f"Failed to calculate plot metrics: {e}")
-            return [{'hhi': 0.0, 'knee_dist': 0.0, 'vi': 0.0} for _ in results_data]
+            return [{'hhi': 0.0, 'knee_dist': 0.0, 'vi_stability': 0.0} for _ in results_data]
 
 class HistogramPlotter:
     """Utility class for plotting histograms on matplotlib widgets."""
+
+    # Above this many particles the volume/contacts scatter is drawn with hexbin
+    HEXBIN_THRESHOLD = 5000
+
+    @staticmethod
+    def _is_unchanged(mpl_widget: MplWidget, kind: str, data: Dict, *arrays: np.ndarray) -> bool:
+        """Return True if *mpl_widget* already shows this plot for the same data.
+
+        The data is identified by a digest of the plotted arrays (order and
+        pairing included) plus the scalar fields of *data* shown in the legend
+        and stats text. The key is stored on the widget; a different key
+        replaces it.
+        """
+        fields = tuple(sorted(
+            (k, v) for k, v in data.items()
+            if isinstance(v, (int, float, str, np.generic))
+        ))
+        key = (kind, _digest(*arrays), fields)
+        if mpl_widget._plot_key == key:
+            logger.debug(f"Skipping {kind} re-plot: data unchanged")
+            return True
+        mpl_widget._plot_key = key
+        return False
     
     @staticmethod
     def plot_contact_histogram(mpl_widget: MplWidget, contact_data: Dict) -> None:
@@ -292,7 +603,7 @@ class HistogramPlotter:
         
         Args:
             mpl_widget: MplWidget to plot on
-            contact_data: Dict with keys 'values' (list of contact counts),
+            contact_data: Dict with keys 'values' (array or list of contact counts),
                           'min', 'max', 'mean', 'median'
         """
         if not contact_data or 'values' not in contact_data:
@@ -300,31 +611,35 @@ class HistogramPlotter:
             return
         
         try:
-            # Clear previous plot
-            mpl_widget.clear()
+            values = np.asarray(contact_data['values'])
+            if HistogramPlotter._is_unchanged(mpl_widget, 'contacts', contact_data, values):
+                return
             
-            # Create subplot
-            ax = mpl_widget.figure.add_subplot(111)
+            # Reuse the widget's axes, clearing the previous plot
+            ax = mpl_widget.get_axes()
+            ax.cla()
             
             # Plot histogram
-            values = contact_data['values']
-            min_contact = int(min(values))
-            max_contact = int(max(values))
+            # Min/median/max and the robust X upper bound (avoids heavy outliers) in one pass
+            vmin, vmedian, upper, vmax = robust_summary(values, 99.5, 1.05)
+            min_contact = int(vmin)
+            max_contact = int(vmax)
             
-            # Auto scale X upper bound using robust percentile to avoid heavy outliers
-            upper = robust_upper_bound(values, 99.5, 1.05)
             x_upper = max(10, min(max_contact, int(upper) + 1))
 
-            # Integer bins for contact counts
-            bin_range = range(min_contact, x_upper + 1)
-
-            # Plot histogram with proper binning
-            n, bins, patches = ax.hist(values, bins=bin_range,
-                                      color='#5a9bd3', edgecolor='white', alpha=0.8)
+            # Integer bins for contact counts: bincount indexes directly by value.
+            # Bars are [k, k+1) for k in min_contact..x_upper-1; like np.histogram,
+            # the last bin is closed so it also takes the values equal to x_upper.
+            counts = np.bincount(values.astype(np.int64), minlength=x_upper + 1)
+            counts = counts[min_contact:x_upper + 1].copy()
+            if counts.size >= 2:
+                counts[-2] += counts[-1]
+            ax.bar(np.arange(min_contact, x_upper), counts[:-1], width=1.0, align='edge',
+                   color='#5a9bd3', edgecolor='white', alpha=0.8)
             
             # Add mean and median lines
-            mean_val = contact_data.get('mean', np.mean(values))
-            median_val = contact_data.get('median', np.median(values))
+            mean_val = contact_data['mean'] if 'mean' in contact_data else float(values.mean())
+            median_val = contact_data.get('median', vmedian)
             
             ax.axvline(mean_val, color='#5cb85c', linestyle='--', linewidth=2, 
                       label=f'Mean: {mean_val:.1f}')
@@ -363,12 +678,12 @@ class HistogramPlotter:
             # Dark theme styling
             style_dark_axes(ax)
             
-            mpl_widget.figure.tight_layout()
-            mpl_widget.canvas.draw()
+            mpl_widget.request_draw()
             
             logger.info(f"✅ Plotted contact histogram: {len(values)} particles, mean={mean_val:.2f}")
         
         except Exception as e:
+            mpl_widget._plot_key = None
             logger.error(f"Failed to plot contact histogram: {e}")
             import traceback
             traceback.print_exc()
@@ -379,7 +694,7 @@ class HistogramPlotter:
         
         Args:
             mpl_widget: MplWidget to plot on
-            volume_data: Dict with keys 'values' (list of volumes),
+            volume_data: Dict with keys 'values' (array or list of volumes),
                          'min', 'max', 'mean', 'median'
         """
         if not volume_data or 'values' not in volume_data:
@@ -387,20 +702,21 @@ class HistogramPlotter:
             return
         
         try:
-            # Clear previous plot
-            mpl_widget.clear()
+            values = np.asarray(volume_data['values'])
+            if HistogramPlotter._is_unchanged(mpl_widget, 'volumes', volume_data, values):
+                return
             
-            # Create subplot
-            ax = mpl_widget.figure.add_subplot(111)
+            # Reuse the widget's axes, clearing the previous plot
+            ax = mpl_widget.get_axes()
+            ax.cla()
             
-            values = volume_data['values']
             # Robust X upper bound using percentile (handles huge outliers)
-            x_upper = robust_upper_bound(values, 99.0, 1.05)
+            _, vmedian, x_upper, _ = robust_summary(values, 99.0, 1.05)
             ax.hist(values, bins=50, color='#d9534f', edgecolor='white', alpha=0.8)
             
             # Add mean and median lines
-            mean_val = volume_data.get('mean', np.mean(values))
-            median_val = volume_data.get('median', np.median(values))
+            mean_val = volume_data['mean'] if 'mean' in volume_data else float(values.mean())
+            median_val = volume_data.get('median', vmedian)
             
             ax.axvline(mean_val, color='#5cb85c', linestyle='--', linewidth=2, 
                       label=f'Mean: {mean_val:.0f} voxels')
@@ -425,7 +741,7 @@ class HistogramPlotter:
             except Exception:
                 pass
             
-            # Add statistics text
+            # Add statistics text (inside the axes, so kept out of the layout solve)
             interior_count = volume_data.get('interior_count', len(values))
             excluded_count = volume_data.get('excluded_count', 0)
             stats_text = (
@@ -436,14 +752,14 @@ class HistogramPlotter:
             ax.text(0.98, 0.98, stats_text, transform=ax.transAxes, 
                    verticalalignment='top', horizontalalignment='right',
                    bbox=dict(boxstyle='round', facecolor='#23272e', alpha=0.8, edgecolor='white'),
-                   fontsize=9, color='white')
+                   fontsize=9, color='white', in_layout=False)
             
-            mpl_widget.figure.tight_layout()
-            mpl_widget.canvas.draw()
+            mpl_widget.request_draw()
             
             logger.info(f"\u2705 Plotted volume histogram: {len(values)} particles, mean={mean_val:.0f}")
         
         except Exception as e:
+            mpl_widget._plot_key = None
             logger.error(f"Failed to plot volume histogram: {e}")
             import traceback
             traceback.print_exc()
@@ -455,36 +771,45 @@ class HistogramPlotter:
         
         Args:
             mpl_widget: MplWidget to plot on
-            scatter_data: Dict with keys 'volumes' (list), 'contacts' (list),
-                          'particle_ids' (list), 'interior_count', 'excluded_count'
+            scatter_data: Dict with keys 'volumes', 'contacts', 'particle_ids'
+                          (aligned arrays), 'interior_count', 'excluded_count'
         """
         if not scatter_data or 'volumes' not in scatter_data or 'contacts' not in scatter_data:
             logger.warning("Invalid scatter data")
             return
         
         try:
-            # Clear previous plot
-            mpl_widget.clear()
+            volumes = np.asarray(scatter_data['volumes'], dtype=np.float64)
+            contacts = np.asarray(scatter_data['contacts'], dtype=np.float64)
+            if HistogramPlotter._is_unchanged(mpl_widget, 'scatter', scatter_data,
+                                              volumes, contacts):
+                return
             
-            # Create subplot
-            ax = mpl_widget.figure.add_subplot(111)
+            # Reuse the widget's axes, clearing the previous plot
+            ax = mpl_widget.get_axes()
+            ax.cla()
             
-            volumes = np.array(scatter_data['volumes'])
-            contacts = np.array(scatter_data['contacts'])
+            vol_min, _, x_upper, vol_max = robust_summary(volumes, 99.0, 1.05)
             
-            # Scatter plot
-            ax.scatter(volumes, contacts, c='#5a9bd3', alpha=0.4, s=15, edgecolors='none')
+            # Scatter plot; large populations are drawn as a density map, whose
+            # cost is bounded by the grid size rather than the particle count
+            if len(volumes) > HistogramPlotter.HEXBIN_THRESHOLD:
+                ax.hexbin(volumes, contacts, gridsize=60, cmap='Blues', mincnt=1, bins='log')
+            else:
+                ax.scatter(volumes, contacts, c='#5a9bd3', alpha=0.4, s=15, edgecolors='none')
             
             # Linear regression line
             if len(volumes) > 2:
                 coeffs = np.polyfit(volumes, contacts, 1)
-                poly = np.poly1d(coeffs)
-                x_fit = np.linspace(volumes.min(), volumes.max(), 100)
-                ax.plot(x_fit, poly(x_fit), color='#f0ad4e', linewidth=2, linestyle='--',
+                x_fit = np.linspace(vol_min, vol_max, 100)
+                ax.plot(x_fit, np.polyval(coeffs, x_fit), color='#f0ad4e', linewidth=2, linestyle='--',
                        label=f'Linear fit (slope={coeffs[0]:.4f})')
                 
                 # Correlation coefficient
-                corr = np.corrcoef(volumes, contacts)[0, 1]
+                dv = volumes - volumes.mean()
+                dc = contacts - contacts.mean()
+                denom = np.sqrt(np.dot(dv, dv) * np.dot(dc, dc))
+                corr = np.dot(dv, dc) / denom if denom > 0 else float('nan')
                 ax.plot([], [], ' ', label=f'R = {corr:.3f}')
             
             # Styling
@@ -500,11 +825,10 @@ class HistogramPlotter:
             style_dark_axes(ax)
             
             # Robust X upper bound
-            x_upper = robust_upper_bound(volumes, 99.0, 1.05)
             if x_upper > 0:
                 ax.set_xlim(0, x_upper)
             
-            # Add statistics text
+            # Add statistics text (inside the axes, so kept out of the layout solve)
             interior_count = scatter_data.get('interior_count', len(volumes))
             excluded_count = scatter_data.get('excluded_count', 0)
             stats_text = (
@@ -514,17 +838,17 @@ class HistogramPlotter:
             ax.text(0.98, 0.98, stats_text, transform=ax.transAxes,
                    verticalalignment='top', horizontalalignment='right',
                    bbox=dict(boxstyle='round', facecolor='#23272e', alpha=0.8, edgecolor='white'),
-                   fontsize=9, color='white')
+                   fontsize=9, color='white', in_layout=False)
             
-            mpl_widget.figure.tight_layout()
-            mpl_widget.canvas.draw()
+            mpl_widget.request_draw()
             
             logger.info(f"\u2705 Plotted volume vs contacts scatter: {len(volumes)} particles")
         
         except Exception as e:
+            mpl_widget._plot_key = None
             logger.error(f"Failed to plot volume vs contacts scatter: {e}")
             import traceback
             traceback.print_exc()
 
 
-__all__ = ["MplWidget", "ResultsTable", "ResultsPlotter", "HistogramPlotter"]
\ No newline at end of file
+__all__ = ["MplWidget", "ResultsModel", "ResultsTable", "ResultsPlotter", "HistogramPlotter"]
\ No newline at end of file
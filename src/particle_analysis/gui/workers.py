@@ -5,32 +5,79 @@ intensive tasks without blocking the GUI main thread.
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 from qtpy.QtCore import QThread
 from qtpy.QtCore import Signal as pyqtSignal
 
+from ..utils.common import resolve_labels_path
+from ..volume import OptimizationCancelled, optimize_radius_advanced
+from .results_export import (
+    analyze_best_labels,
+    build_contact_histogram,
+    build_volume_histogram,
+    build_scatter_data,
+    save_analysis_csvs,
+    load_analysis_cache,
+)
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ProgressEvent:
+    """A progress update delivered to the GUI in a single signal.
+
+    Radius steps are throttled together with their ``percent``/``text``:
+    results finished between two emissions are held back and delivered as a
+    batch in ``results`` (in completion order), so the table and plots still
+    receive every radius. Stage changes carry no results. Fields left as
+    None are not updated.
+    """
+    results: tuple = ()  # OptimizationResult objects since the last emission
+    percent: Optional[int] = None
+    text: Optional[str] = None
+    stage: Optional[str] = None
+
+
+class _RateLimiter:
+    """Let an event through at most *rate_hz* times per second (monotonic clock)."""
+
+    def __init__(self, rate_hz: float):
+        self.interval_ns = int(1e9 / rate_hz)
+        self._last_ns = None
+
+    def ready(self, force: bool = False) -> bool:
+        """Return True (and restart the interval) if an event may be sent now."""
+        now = time.monotonic_ns()
+        if not force and self._last_ns is not None and now - self._last_ns < self.interval_ns:
+            return False
+        self._last_ns = now
+        return True
+
+
 class OptimizationWorker(QThread):
     """Worker thread for radius optimization to prevent GUI freezing."""
     
     # Signals for GUI updates
-    progress_updated = pyqtSignal(object)  # OptimizationResult (for table updates)
+    progress_event = pyqtSignal(object)  # ProgressEvent (status text, percentage, stage, results)
     optimization_complete = pyqtSignal(object, object, object, object)  # (OptimizationSummary, contact_histogram_data, volume_histogram_data, scatter_data)
     error_occurred = pyqtSignal(str)  # Error message
+    csv_saved = pyqtSignal(str)  # Output directory, once the analysis CSVs are written
     
-    # NEW: Additional signals for detailed progress tracking
-    progress_text_updated = pyqtSignal(str)  # Status text (e.g., "r=3の解析中...")
-    progress_percentage_updated = pyqtSignal(int)  # Progress bar value (0-100)
-    stage_changed = pyqtSignal(str)  # Processing stage (e.g., "watershed", "contacts", "optimization")
+    # Maximum rate of progress text/percentage updates (about one per frame)
+    PROGRESS_RATE_HZ = 30
     
     def __init__(self, volume: np.ndarray, output_dir: str, radii: List[int], connectivity: int = 6,
                  tau_ratio: float = 0.03,
-                 contacts_range: tuple[int, int] = (5, 9), smoothing_window: int | None = None):
+                 contacts_range: tuple[int, int] = (5, 9), smoothing_window: int | None = None,
+                 n_jobs: int = 1):
         super().__init__()
         self.volume = volume
         self.output_dir = output_dir
@@ -39,52 +86,58 @@ class OptimizationWorker(QThread):
         self.tau_ratio = tau_ratio
         self.contacts_range = contacts_range
         self.smoothing_window = smoothing_window
-        self.is_cancelled = False
+        self.n_jobs = n_jobs  # Processes for evaluating radii in parallel
+        self._cancel_event = threading.Event()
         self.total_steps = len(radii) if radii else 1  # For percentage calculation
+        self._radius_to_index = {r: i for i, r in enumerate(radii or [])}
+        self._progress_limiter = _RateLimiter(self.PROGRESS_RATE_HZ)
+        self._pending_results: List = []  # results not yet sent to the GUI
     
     def run(self):
         """Execute the optimization in a separate thread."""
         try:
-            from ..volume import optimize_radius_advanced
-            
             # Enhanced progress callback with detailed GUI updates
             def progress_callback(result):
-                if not self.is_cancelled:
-                    # Emit the full result object (for internal processing)
-                    self.progress_updated.emit(result)
-                    
-                    # Calculate and emit progress percentage
-                    current_index = self.radii.index(result.radius) if result.radius in self.radii else 0
-                    # Reserve last 10% for final optimization selection
-                    progress_pct = int((current_index + 1) / self.total_steps * 90)
-                    self.progress_percentage_updated.emit(progress_pct)
-                    
-                    # Emit detailed progress text (with guard volume info if available)
-                    if hasattr(result, 'interior_particle_count') and result.interior_particle_count > 0:
-                        text = (
-                            f"r = {result.radius}: {result.particle_count} particles "
-                            f"({result.interior_particle_count} interior, {result.excluded_particle_count} excluded), "
-                            f"{result.mean_contacts:.1f} avg contacts (interior only)"
-                        )
-                    else:
-                        text = (
-                            f"r = {result.radius}: {result.particle_count} particles, "
-                            f"{result.mean_contacts:.1f} avg contacts"
-                        )
-                    self.progress_text_updated.emit(text)
-                    
-                    logger.info(f"Progress update: {text} ({progress_pct}%)")
+                # Calculate progress percentage
+                current_index = self._radius_to_index.get(result.radius, 0)
+                # Reserve last 10% for final optimization selection
+                progress_pct = int((current_index + 1) / self.total_steps * 90)
+                
+                # Coalesce updates arriving faster than the GUI can show them:
+                # the result waits for the next emission; the last radius is
+                # always reported
+                self._pending_results.append(result)
+                is_last = current_index + 1 >= self.total_steps
+                if not self._progress_limiter.ready(force=is_last):
+                    return
+                
+                # Detailed progress text (with guard volume info if available)
+                if hasattr(result, 'interior_particle_count') and result.interior_particle_count > 0:
+                    text = (
+                        f"r = {result.radius}: {result.particle_count} particles "
+                        f"({result.interior_particle_count} interior, {result.excluded_particle_count} excluded), "
+                        f"{result.mean_contacts:.1f} avg contacts (interior only)"
+                    )
+                else:
+                    text = (
+                        f"r = {result.radius}: {result.particle_count} particles, "
+                        f"{result.mean_contacts:.1f} avg contacts"
+                    )
+                # One cross-thread emission carries the results, percentage and text
+                self.progress_event.emit(ProgressEvent(self._take_pending_results(), progress_pct, text))
+                
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Progress update: %s (%d%%)", text, progress_pct)
             
             # Initial status
-            self.stage_changed.emit("initialization")
-            self.progress_text_updated.emit("Starting radius optimization...")
-            self.progress_percentage_updated.emit(0)
+            self.progress_event.emit(ProgressEvent(
+                percent=0, text="Starting radius optimization...", stage="initialization"))
             
             # Run optimization
-            logger.info(f"Starting optimization for radii: {self.radii}")
-            logger.info(f"Using connectivity: {self.connectivity}")
+            logger.info("Starting optimization for radii: %s", self.radii)
+            logger.info("Using connectivity: %s", self.connectivity)
             
-            self.stage_changed.emit("optimization")
+            self.progress_event.emit(ProgressEvent(stage="optimization"))
             summary = optimize_radius_advanced(
                 vol_path=None,
                 output_dir=self.output_dir,
@@ -97,19 +150,21 @@ class OptimizationWorker(QThread):
                 contacts_range=self.contacts_range,
                 smoothing_window=self.smoothing_window,
                 volume=self.volume,
+                n_jobs=self.n_jobs,
+                cancel_check=self._cancel_event.is_set,
             )
             
-            logger.info(f"Optimization completed. Summary: {summary}")
-            logger.info(f"Best radius: {summary.best_radius if summary else 'None'}")
-            logger.info(f"Is cancelled: {self.is_cancelled}")
+            # Summary repr covers every result; only built if INFO is enabled
+            logger.info("Optimization completed. Summary: %s", summary)
+            logger.info("Best radius: %s", summary.best_radius if summary else None)
+            logger.info("Is cancelled: %s", self.is_cancelled)
             
             if not self.is_cancelled:
                 # Final stage: Selecting best radius
-                self.stage_changed.emit("finalization")
-                self.progress_text_updated.emit("最適rを選定中...")
-                self.progress_percentage_updated.emit(95)
+                self.progress_event.emit(ProgressEvent(
+                    percent=95, text="最適rを選定中...", stage="finalization"))
                 
-                # Results are saved within optimizer (optimization_results.csv and labels_r{best}.npy)
+                # Results are saved within optimizer (optimization_results.feather and labels_r{best}.npy)
                 
                 # Calculate histogram data for final visualization
                 logger.info("Calculating histogram data for visualization...")
@@ -121,21 +176,44 @@ class OptimizationWorker(QThread):
                 logger.info("Signal emitted successfully")
                 
                 # Final status
-                self.progress_text_updated.emit(f"✅ 完了！最適r = {summary.best_radius}")
-                self.progress_percentage_updated.emit(100)
+                self.progress_event.emit(ProgressEvent(
+                    percent=100, text=f"✅ 完了！最適r = {summary.best_radius}"))
                 
+        except OptimizationCancelled:
+            logger.info("Optimization stopped by user")
         except Exception as e:
             logger.error(f"Optimization failed: {e}")
             self.error_occurred.emit(str(e))
-            self.progress_text_updated.emit(f"❌ エラー: {str(e)}")
+            self.progress_event.emit(ProgressEvent(text=f"❌ エラー: {str(e)}"))
             import traceback
             traceback.print_exc()
+        finally:
+            # Results held back by the throttle when the run stopped early
+            if self._pending_results:
+                self.progress_event.emit(ProgressEvent(self._take_pending_results()))
+    
+    def _take_pending_results(self) -> tuple:
+        """Return the held-back results and clear the queue."""
+        results = tuple(self._pending_results)
+        self._pending_results.clear()
+        return results
+    
+    @property
+    def is_cancelled(self) -> bool:
+        """True once :meth:`cancel` has been called (thread-safe)."""
+        return self._cancel_event.is_set()
     
     def cancel(self):
-        """Cancel the optimization."""
-        self.is_cancelled = True
-        self.terminate()
+        """Request cancellation; the worker stops after the current radius."""
+        self._cancel_event.set()
     
+    def _on_csvs_saved(self, future, output_dir: Path) -> None:
+        """Report the background CSV export (runs on the I/O pool thread)."""
+        if future.exception() is not None:
+            logger.error(f"CSV export failed: {future.exception()}")
+            return
+        self.csv_saved.emit(str(output_dir))
+
     def _calculate_histogram_data(self, summary):
         """Calculate histogram data for visualization and save CSVs.
 
@@ -146,19 +224,19 @@ class OptimizationWorker(QThread):
             tuple: (contact_histogram_data, volume_histogram_data, scatter_data)
                    Each is a dict or None if calculation fails.
         """
-        from .results_export import (
-            analyze_best_labels,
-            build_contact_histogram,
-            build_volume_histogram,
-            build_scatter_data,
-            save_analysis_csvs,
-        )
-
         output_dir = Path(self.output_dir)
         labels_path = output_dir / f"labels_r{summary.best_radius}.npy"
+        # Interior contacts/volumes written by the optimizer for this radius
+        stats_path = output_dir / f"particles_r{summary.best_radius}.npz"
 
         try:
-            analysis = analyze_best_labels(labels_path, self.connectivity)
+            labels_file = resolve_labels_path(labels_path)
+            if stats_path.exists() and stats_path.stat().st_mtime_ns >= labels_file.stat().st_mtime_ns:
+                # Fresh from this run: no need to re-analyse the labels
+                logger.info(f"Using optimizer particle stats: {stats_path.name}")
+                analysis = load_analysis_cache(stats_path)
+            else:
+                analysis = analyze_best_labels(labels_file, self.connectivity)
         except (FileNotFoundError, ValueError) as e:
             logger.warning(f"Skipping histogram/CSV: {e}")
             return None, None, None
@@ -168,13 +246,21 @@ class OptimizationWorker(QThread):
             traceback.print_exc()
             return None, None, None
 
+        if self._cancel_event.is_set():
+            logger.info("Cancelled before building histogram data")
+            return None, None, None
+
+        # Save the CSV files (for Excel graph generation) in the background; the
+        # completion signal does not wait for them and csv_saved follows later.
+        # The pool's thread exits once the export is done.
+        io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="csv-export")
+        csv_future = io_pool.submit(save_analysis_csvs, output_dir, analysis)
+        csv_future.add_done_callback(lambda f: self._on_csvs_saved(f, output_dir))
+        io_pool.shutdown(wait=False)
+
         contact_histogram = build_contact_histogram(analysis)
         volume_histogram = build_volume_histogram(analysis)
         scatter_data = build_scatter_data(analysis)
-
-        # Save CSV files for Excel graph generation
-        save_analysis_csvs(output_dir, analysis)
-
         return contact_histogram, volume_histogram, scatter_data
 
-__all__ = ["OptimizationWorker"]
\ No newline at end of file
+__all__ = ["OptimizationWorker", "ProgressEvent"]
\ No newline at end of file
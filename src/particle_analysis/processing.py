@@ -1,17 +1,17 @@
 """Core image processing functions for particle analysis."""
 
 import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
+from scipy import ndimage
 from skimage.filters import threshold_otsu
-from skimage.morphology import (
-    binary_closing,
-    ball,
-    remove_small_objects
-)
+from skimage.morphology import ball
 
 from .config import PostprocessConfig, DEFAULT_CONFIG
 from .utils.common import Timer
@@ -19,12 +19,175 @@ from .utils.file_utils import get_image_files
 
 logger = logging.getLogger(__name__)
 
+# Slice decoding is mostly disk- and libtiff-bound; more threads than this
+# oversubscribe the cores that NumPy/numba use later without loading faster
+_DEFAULT_LOAD_WORKERS = min(8, os.cpu_count() or 1)
+
+# From this closing radius on, two distance transforms beat sweeping the
+# (2r+1)^3 ball footprint
+_EDT_CLOSING_MIN_RADIUS = 4
+
+
+def _read_slice_into(
+    volume: np.ndarray, index: int, img_path: Path, minlength: int = 0
+) -> Optional[np.ndarray]:
+    """Decode one image straight into ``volume[index]``.
+    
+    With a non-zero *minlength* the slice's bincount is returned while it is
+    still in cache, so the Otsu histogram needs no separate pass over the
+    volume. An unreadable slice is left as zeros.
+    """
+    img = cv2.imread(str(img_path), cv2.IMREAD_UNCHANGED)
+    if img is None:
+        logger.warning(f"Failed to load image: {img_path}, skipping")
+    else:
+        volume[index] = img
+    if minlength:
+        return np.bincount(volume[index].ravel(), minlength=minlength)
+    return None
+
+
+def _read_slice_or_zeros(img_path: Path, shape: Tuple[int, int], dtype: np.dtype) -> np.ndarray:
+    """Decode one image; an unreadable slice reads as zeros, as in the in-memory volume."""
+    img = cv2.imread(str(img_path), cv2.IMREAD_UNCHANGED)
+    if img is None:
+        logger.warning(f"Failed to load image: {img_path}, skipping")
+        return np.zeros(shape, dtype=dtype)
+    return img
+
+
+def _stream_histogram(image_files: List[Path], first_img: np.ndarray, num_workers: int) -> np.ndarray:
+    """Bincount histogram of all slices without keeping the decoded volume."""
+    minlength = np.iinfo(first_img.dtype).max + 1
+    hist = np.bincount(first_img.ravel(), minlength=minlength)
+    
+    def slice_counts(img_path):
+        img = _read_slice_or_zeros(img_path, first_img.shape, first_img.dtype)
+        return np.bincount(img.ravel(), minlength=minlength)
+    
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        for counts in pool.map(slice_counts, image_files[1:]):
+            hist += counts
+    return hist
+
+
+def _stream_compare(
+    image_files: List[Path], first_img: np.ndarray, compare, threshold, num_workers: int
+) -> np.ndarray:
+    """Decode the slices again and write ``compare(slice, threshold)`` into a bool volume."""
+    binary = np.empty((len(image_files),) + first_img.shape, dtype=bool)
+    compare(first_img, threshold, out=binary[0])
+    
+    def fill(index, img_path):
+        img = _read_slice_or_zeros(img_path, first_img.shape, first_img.dtype)
+        compare(img, threshold, out=binary[index])
+    
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        for future in [pool.submit(fill, i, p) for i, p in enumerate(image_files[1:], start=1)]:
+            future.result()
+    return binary
+
+
+def _otsu_from_counts(counts: np.ndarray, start: int = 0) -> int:
+    """Otsu threshold of integer values given their histogram.
+
+    ``counts[k]`` is the number of voxels with value ``start + k``. Same
+    criterion as :func:`skimage.filters.threshold_otsu`, whose integer path
+    also works on a bincount histogram, so the result is identical.
+    """
+    nonzero = np.flatnonzero(counts)
+    lo, hi = nonzero[0], nonzero[-1]
+    if lo == hi:
+        return start + int(lo)
+    # float32 counts as in scikit-image, so ties resolve the same way
+    counts = counts[lo:hi + 1].astype(np.float32)
+    centers = np.arange(start + lo, start + hi + 1, dtype=np.float64)
+
+    weight1 = np.cumsum(counts)
+    weight2 = np.cumsum(counts[::-1])[::-1]
+    mean1 = np.cumsum(counts * centers) / weight1
+    mean2 = (np.cumsum((counts * centers)[::-1]) / weight2[::-1])[::-1]
+    variance12 = weight1[:-1] * weight2[1:] * (mean1[:-1] - mean2[1:]) ** 2
+    return int(centers[np.argmax(variance12)])
+
+
+def _within_distance(mask: np.ndarray, radius: int, slab: int) -> np.ndarray:
+    """Voxels whose Euclidean distance to the nearest False voxel of *mask* exceeds *radius*.
+
+    Voxels outside the array do not count as False. The distance transform is
+    taken on z-slabs with a *radius* halo, which is exact because nothing
+    farther than *radius* along z can be within *radius*.
+    """
+    out = np.empty(mask.shape, dtype=bool)
+    depth = mask.shape[0]
+    for z0 in range(0, depth, slab):
+        z1 = min(depth, z0 + slab)
+        lo, hi = max(0, z0 - radius), min(depth, z1 + radius)
+        block = mask[lo:hi]
+        if block.all():
+            out[z0:z1] = True
+            continue
+        dist = ndimage.distance_transform_edt(block)
+        out[z0:z1] = dist[z0 - lo:z1 - lo] > radius
+    return out
+
+
+def _binary_closing_ball(binary: np.ndarray, radius: int, slab: int = 64) -> np.ndarray:
+    """Binary closing with the ``skimage.morphology.ball(radius)`` footprint.
+
+    Dilation by a ball keeps voxels within *radius* of the foreground and
+    erosion keeps voxels farther than *radius* from the background, so from
+    ``_EDT_CLOSING_MIN_RADIUS`` on two Euclidean distance transforms replace
+    the (2r+1)^3 footprint sweeps. Smaller radii use the footprint directly.
+    Border handling matches ``skimage.morphology.binary_closing`` (outside is
+    background for the dilation and foreground for the erosion).
+    """
+    if radius < _EDT_CLOSING_MIN_RADIUS:
+        footprint = ball(radius).astype(bool)
+        dilated = ndimage.binary_dilation(binary, footprint)
+        return ndimage.binary_erosion(dilated, footprint, border_value=1)
+    dilated = ~_within_distance(~binary, radius, slab)
+    return _within_distance(dilated, radius, slab)
+
+
+def _remove_small_objects(binary: np.ndarray, min_size: int) -> np.ndarray:
+    """Drop 6-connected components with fewer than *min_size* voxels.
+
+    Matches the strict ``min_size`` threshold of
+    ``skimage.morphology.remove_small_objects`` (before 0.26 made it
+    inclusive), but the kept-component lookup produces the output directly
+    instead of copying the input and clearing a second full mask.
+    """
+    components = np.empty(binary.shape, dtype=np.int32)
+    ndimage.label(binary, ndimage.generate_binary_structure(binary.ndim, 1), output=components)
+    keep = np.bincount(components.ravel()) >= min_size
+    keep[0] = False
+    return keep[components]
+
+
+def _stats_from_hist(hist: np.ndarray, threshold: int) -> Tuple[int, int, float, float]:
+    """Voxel counts and mean values at or below / above *threshold* from a bincount.
+
+    Returns:
+        ``(count_below, count_above, mean_below, mean_above)``; a mean is 0
+        when its side is empty.
+    """
+    split = int(threshold) + 1
+    weighted = hist * np.arange(hist.size, dtype=np.float64)
+    count_below = int(hist[:split].sum())
+    count_above = int(hist[split:].sum())
+    mean_below = weighted[:split].sum() / count_below if count_below else 0
+    mean_above = weighted[split:].sum() / count_above if count_above else 0
+    return count_below, count_above, mean_below, mean_above
+
 
 def load_and_binarize_3d_volume(
     folder_path: str,
     min_object_size: int = 100,
     closing_radius: int = 0,
-    return_info: bool = False
+    return_info: bool = False,
+    low_memory: bool = False,
+    num_workers: Optional[int] = None
 ) -> np.ndarray:
     """Load TIF images and perform high-precision 3D Otsu binarization.
     
@@ -39,6 +202,11 @@ def load_and_binarize_3d_volume(
         min_object_size: Minimum object size for small object removal (0 to disable)
         closing_radius: Radius for binary closing operation (0 to disable)
         return_info: If True, returns tuple (binary_volume, info_dict)
+        low_memory: If True, do not keep the grey-level volume in RAM. Unsigned
+            integer images keep only their intensity histogram and are decoded a
+            second time to binarize (about 3x lower peak memory); float images
+            are paged through a temporary file
+        num_workers: Threads decoding slices (default: CPU count, at most 8)
         
     Returns:
         Binary 3D volume (bool array) with shape (Z, Y, X)
@@ -72,52 +240,102 @@ def load_and_binarize_3d_volume(
     logger.info(f"Volume dimensions: Z={z_slices}, H={height}, W={width}, dtype={dtype}")
     
     # Step 3: Load all images into 3D volume (preserve uint16!)
+    # OpenCV releases the GIL while decoding, so slices are read on a thread
+    # pool and written directly into the preallocated volume
+    num_workers = num_workers or _DEFAULT_LOAD_WORKERS
+    hist = None
+    scratch = None
     with Timer("Loading 3D volume"):
-        volume = np.zeros((z_slices, height, width), dtype=dtype)
-        
-        for i, img_path in enumerate(image_files):
-            img = cv2.imread(str(img_path), cv2.IMREAD_UNCHANGED)
-            if img is None:
-                logger.warning(f"Failed to load image: {img_path}, skipping")
-                continue
-            
-            volume[i] = img
+        if low_memory and dtype.kind == 'u':
+            # Otsu and polarity only need the histogram
+            volume = None
+            hist = _stream_histogram(image_files, first_img, num_workers)
+            logger.info(f"Histogrammed {z_slices} images (low-memory mode)")
+        else:
+            if low_memory:
+                # Float slices have no exact histogram; page the grey levels
+                # through a scratch file instead of keeping them resident
+                scratch = tempfile.TemporaryFile()
+                volume = np.memmap(scratch, dtype=dtype, mode='w+', shape=(z_slices, height, width))
+            else:
+                volume = np.zeros((z_slices, height, width), dtype=dtype)
+            volume[0] = first_img
+            # Integer slices are histogrammed as they are decoded
+            minlength = np.iinfo(dtype).max + 1 if dtype.kind == 'u' else 0
+            if minlength:
+                hist = np.bincount(first_img.ravel(), minlength=minlength)
             
-            if (i + 1) % 50 == 0 or i == z_slices - 1:
-                logger.info(f"Loaded {i + 1}/{z_slices} images...")
+            with ThreadPoolExecutor(max_workers=num_workers) as pool:
+                futures = [
+                    pool.submit(_read_slice_into, volume, i, img_path, minlength)
+                    for i, img_path in enumerate(image_files[1:], start=1)
+                ]
+                for done, future in enumerate(as_completed(futures), start=2):
+                    counts = future.result()
+                    if counts is not None:
+                        hist += counts
+                    if done % 50 == 0 or done == z_slices:
+                        logger.info(f"Loaded {done}/{z_slices} images...")
+    n_voxels = z_slices * height * width
     
     # Step 4: 2-stage 3D Otsu thresholding (following sakai_code approach)
     # This is crucial for CT data with wide dynamic range
     with Timer("2-stage 3D Otsu thresholding"):
-        # Stage 1: First Otsu on entire volume (separates background from potential foreground)
-        threshold1 = threshold_otsu(volume)
-        logger.info(f"Stage 1 Otsu threshold: {threshold1} (dtype: {dtype}, range: {volume.min()}-{volume.max()})")
-        
-        # Extract voxels above first threshold
-        above_threshold1 = volume > threshold1
-        foreground_voxels = volume[above_threshold1]
-        
-        if len(foreground_voxels) == 0:
-            logger.warning("No voxels above first threshold! Using single-stage Otsu")
-            threshold2 = threshold1
+        if dtype.kind == 'u':
+            # The histogram built while loading serves both stages: stage 2
+            # only needs its tail above the first threshold
+            values = np.flatnonzero(hist)
+            vmin, vmax = int(values[0]), int(values[-1])
+            
+            # Stage 1: First Otsu on entire volume (separates background from potential foreground)
+            threshold1 = _otsu_from_counts(hist)
+            logger.info(f"Stage 1 Otsu threshold: {threshold1} (dtype: {dtype}, range: {vmin}-{vmax})")
+            
+            tail = hist[threshold1 + 1:]
+            if not tail.any():
+                logger.warning("No voxels above first threshold! Using single-stage Otsu")
+                threshold2 = threshold1
+            else:
+                # Stage 2: Second Otsu on the foreground tail (refines particle separation)
+                threshold2 = _otsu_from_counts(tail, start=threshold1 + 1)
+                fg_min = threshold1 + 1 + int(np.flatnonzero(tail)[0])
+                logger.info(f"Stage 2 Otsu threshold: {threshold2} (on foreground range: {fg_min}-{vmax})")
         else:
-            # Stage 2: Second Otsu on extracted foreground region (refines particle separation)
-            threshold2 = threshold_otsu(foreground_voxels)
-            logger.info(f"Stage 2 Otsu threshold: {threshold2} (on foreground range: {foreground_voxels.min()}-{foreground_voxels.max()})")
+            vmin, vmax = volume.min(), volume.max()
+            # Stage 1: First Otsu on entire volume (separates background from potential foreground)
+            # A constant volume has no threshold to search; threshold_otsu
+            # would return that value after another full comparison pass
+            threshold1 = vmin if vmin == vmax else threshold_otsu(volume)
+            logger.info(f"Stage 1 Otsu threshold: {threshold1} (dtype: {dtype}, range: {vmin}-{vmax})")
+            
+            # Extract voxels above first threshold
+            foreground_voxels = volume[volume > threshold1]
+            
+            if len(foreground_voxels) == 0:
+                logger.warning("No voxels above first threshold! Using single-stage Otsu")
+                threshold2 = threshold1
+            else:
+                # Stage 2: Second Otsu on extracted foreground region (refines particle separation)
+                threshold2 = threshold_otsu(foreground_voxels)
+                logger.info(f"Stage 2 Otsu threshold: {threshold2} (on foreground range: {foreground_voxels.min()}-{foreground_voxels.max()})")
         
         logger.info(f"Final threshold: {threshold2}")
     
     # Step 5: Automatic polarity detection
     with Timer("Automatic polarity detection"):
         # Calculate statistics on each side of final threshold
-        below_threshold = volume <= threshold2
-        above_threshold = volume > threshold2
-        
-        mean_below = volume[below_threshold].mean() if below_threshold.any() else 0
-        mean_above = volume[above_threshold].mean() if above_threshold.any() else 0
-        
-        count_below = below_threshold.sum()
-        count_above = above_threshold.sum()
+        if hist is not None:
+            # Counts and means per side come from the histogram; no volume pass
+            count_below, count_above, mean_below, mean_above = _stats_from_hist(hist, threshold2)
+        else:
+            below_threshold = volume <= threshold2
+            above_threshold = volume > threshold2
+            
+            mean_below = volume[below_threshold].mean() if below_threshold.any() else 0
+            mean_above = volume[above_threshold].mean() if above_threshold.any() else 0
+            
+            count_below = np.count_nonzero(below_threshold)
+            count_above = np.count_nonzero(above_threshold)
         
         logger.info(f"Below threshold: mean={mean_below:.1f}, count={count_below:,}")
         logger.info(f"Above threshold: mean={mean_above:.1f}, count={count_above:,}")
@@ -125,42 +343,54 @@ def load_and_binarize_3d_volume(
         # Determine polarity based on which side has fewer voxels
         # Particles are typically the minority phase in CT scans
         # The side with FEWER voxels is likely the foreground (particles)
-        if count_below < count_above:
+        foreground_below = count_below < count_above
+        if foreground_below:
             # Fewer voxels below threshold → particles are below threshold
-            binary_volume = volume <= threshold2
             polarity = "inverted (foreground is darker/below threshold)"
             logger.info(f"✓ Detected polarity: Foreground is BELOW threshold (inverted)")
-            logger.info(f"   Minority phase: {count_below:,} voxels ({count_below/volume.size:.2%})")
+            logger.info(f"   Minority phase: {count_below:,} voxels ({count_below/n_voxels:.2%})")
         else:
             # Fewer voxels above threshold → particles are above threshold
-            binary_volume = volume > threshold2
             polarity = "normal (foreground is brighter/above threshold)"
             logger.info(f"✓ Detected polarity: Foreground is ABOVE threshold (normal)")
-            logger.info(f"   Minority phase: {count_above:,} voxels ({count_above/volume.size:.2%})")
+            logger.info(f"   Minority phase: {count_above:,} voxels ({count_above/n_voxels:.2%})")
+        
+        if hist is None:
+            # Reuse the mask built for the statistics instead of comparing again
+            binary_volume = below_threshold if foreground_below else above_threshold
+            del below_threshold, above_threshold
+        else:
+            compare = np.less_equal if foreground_below else np.greater
+            if volume is None:
+                binary_volume = _stream_compare(image_files, first_img, compare, threshold2, num_workers)
+            else:
+                binary_volume = compare(volume, threshold2)
+    
+    # Only the binary volume is needed from here on; release the grey levels
+    # before the morphology steps allocate their own buffers
+    del volume
+    if scratch is not None:
+        scratch.close()
     
     # Step 6: Post-processing
-    foreground_before = binary_volume.sum()
+    # The minority-side count is exactly the foreground of the fresh mask
+    foreground_before = count_below if foreground_below else count_above
     logger.info(f"Foreground voxels before post-processing: {foreground_before:,}")
     
     # Binary closing (fill small holes)
     if closing_radius > 0:
         with Timer(f"Binary closing (radius={closing_radius})"):
-            selem = ball(closing_radius)
-            binary_volume = binary_closing(binary_volume, selem)
+            binary_volume = _binary_closing_ball(binary_volume, closing_radius)
             logger.info(f"Applied binary closing with radius {closing_radius}")
     
     # Small object removal (remove noise)
     if min_object_size > 0:
         with Timer(f"Small object removal (min_size={min_object_size})"):
-            # Use connectivity=1 for 3D (6-connectivity, face neighbors only)
-            binary_volume = remove_small_objects(
-                binary_volume,
-                min_size=min_object_size,
-                connectivity=1
-            )
+            # 6-connectivity (face neighbors only)
+            binary_volume = _remove_small_objects(binary_volume, min_object_size)
             logger.info(f"Removed objects smaller than {min_object_size} voxels")
     
-    foreground_after = binary_volume.sum()
+    foreground_after = np.count_nonzero(binary_volume)
     foreground_ratio = foreground_after / binary_volume.size
     logger.info(f"Foreground voxels after post-processing: {foreground_after:,} ({foreground_ratio:.2%})")
     
@@ -4,13 +4,16 @@ This package provides utility functions for file handling,
 logging, timing, and other common operations.
 """
 
-from .common import setup_logging, Timer, ensure_directory
+from .common import setup_logging, Timer, ensure_directory, save_labels, load_labels, resolve_labels_path
 from .file_utils import natural_sort_key, get_image_files
 
 __all__ = [
     "setup_logging",
     "Timer", 
     "ensure_directory",
+    "save_labels",
+    "load_labels",
+    "resolve_labels_path",
     "natural_sort_key",
     "get_image_files"
 ]
\ No newline at end of file
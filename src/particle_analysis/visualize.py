@@ -67,7 +67,7 @@ def view_volume(
     if volume_arr.dtype != np.uint8 and volume_arr.dtype != bool:
         volume_arr = volume_arr.astype(np.uint8)
     if volume_arr.dtype == bool:
-        volume_arr = volume_arr.astype(np.uint8) * 255
+        volume_arr = volume_arr.view(np.uint8) * np.uint8(255)  # bool bytes are 0/1
 
     viewer = napari.Viewer(title=title)
     viewer.add_image(volume_arr, name="volume", rendering=rendering, contrast_limits=(0, 255))
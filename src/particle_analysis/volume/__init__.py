@@ -10,7 +10,7 @@ This package handles 3D volume operations including:
 # Import from modular components
 from .data_structures import OptimizationResult, OptimizationSummary
 from .core import split_particles, label_volume
-from .optimizer import optimize_radius_advanced, optimize_radius
+from .optimizer import optimize_radius_advanced, optimize_radius, OptimizationCancelled
 
 # Import from reorganized metrics package
 from .metrics import (
@@ -41,6 +41,7 @@ __all__ = [
     # Optimization orchestration
     "optimize_radius",
     "optimize_radius_advanced",
+    "OptimizationCancelled",
     
     # Data structures
     "OptimizationResult",
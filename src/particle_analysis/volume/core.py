@@ -70,7 +70,7 @@ def split_particles_in_memory(
     # Use watershed to grow seeds back to original boundaries
     distance = ndimage.distance_transform_edt(volume)
     labels = watershed(-distance, seed_labels, mask=volume)
-    return labels.astype(np.int32)
+    return labels.astype(np.int32, copy=False)
 
 
 def label_volume(vol_path: str, out_labels: str, connectivity: int = 6) -> int:
@@ -20,17 +20,19 @@ def calculate_particle_volumes(labels: np.ndarray) -> Dict[int, int]:
         labels: 3D labeled volume where each particle has unique integer ID
         
     Returns:
-        Dict mapping particle_id -> volume_in_voxels
+        Dict mapping particle_id -> volume_in_voxels, in ascending particle_id order
     """
-    unique_labels = np.unique(labels)
-    unique_labels = unique_labels[unique_labels > 0]  # Remove background
+    flat = np.ravel(labels)
+    if flat.size == 0:
+        return {}
+    if flat.dtype.kind == 'i' and flat.min() < 0:
+        flat = flat[flat > 0]
 
-    volumes = {}
-    for label_id in unique_labels:
-        volume = np.sum(labels == label_id)
-        volumes[label_id] = volume
+    # One pass: counts[i] is the voxel count of label i
+    counts = np.bincount(flat)
+    label_ids = np.flatnonzero(counts[1:]) + 1  # Remove background
 
-    return volumes
+    return dict(zip(label_ids.tolist(), counts[label_ids].tolist()))
 
 
 def calculate_largest_particle_ratio(labels: np.ndarray) -> tuple[float, int, int]:
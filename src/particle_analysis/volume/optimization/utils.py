@@ -33,13 +33,10 @@ def detect_knee_point(x_values: List[float], y_values: List[float]) -> int:
     y_norm = (y_norm - y_norm.min()) / (y_norm.max() - y_norm.min())
 
     # Calculate differences from diagonal line
-    differences = []
-    for i in range(len(x_norm)):
-        diff = y_norm[i] - x_norm[i]
-        differences.append(diff)
+    differences = y_norm - x_norm
 
     # Find maximum difference (knee point)
-    knee_idx = np.argmax(differences)
+    knee_idx = int(np.argmax(differences))
 
     return knee_idx
 
@@ -5,17 +5,29 @@ all aspects of radius optimization including volume processing, metric calculati
 and best radius determination.
 """
 
+import io
 import logging
+import multiprocessing
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import Callable, Iterator, List, Optional
 
 import numpy as np
 try:
     import pandas as pd
 except Exception:  # pandas は実行環境により未導入の場合があるため遅延依存
     pd = None  # type: ignore
+try:
+    import psutil
+except ImportError:  # optional: available-memory cap for the process pool
+    psutil = None
 
+from ..contact.guard_volume import count_contacts_with_guard
+from ..utils.common import save_labels
 from .data_structures import OptimizationResult, OptimizationSummary
 from .core import split_particles_in_memory
 from .metrics.basic import calculate_largest_particle_ratio
@@ -24,6 +36,192 @@ from .optimization.algorithms import determine_best_radius_pareto_distance
 logger = logging.getLogger(__name__)
 
 
+class OptimizationCancelled(Exception):
+    """Stops :func:`optimize_radius_advanced` after the current radius.
+
+    Raised when ``cancel_check`` returns True, or by a progress callback
+    (unlike other callback errors it is not swallowed). The results table
+    and labels are not written.
+    """
+
+
+def _evaluate_radius(
+    volume: np.ndarray,
+    r: int,
+    connectivity: int,
+    complete_analysis: bool,
+) -> tuple[OptimizationResult, Optional[tuple]]:
+    """Split *volume* at radius *r* and compute its metrics.
+
+    Returns:
+        (result, interior) where *interior* is ``(ids, contact_counts,
+        guard_stats)`` for the interior particles, or None without contacts
+    """
+    step_start_time = time.time()
+
+    # Run particle splitting in-memory
+    logger.info(f"Processing radius {r}...")
+    labels = split_particles_in_memory(volume, radius=r, connectivity=connectivity)
+    num_particles = int(labels.max())
+
+    # Calculate additional metrics
+    largest_ratio, largest_vol, total_vol = calculate_largest_particle_ratio(labels)
+
+    # Calculate mean contacts if requested (with guard volume filtering)
+    mean_contacts = 0.0
+    interior_particle_count = 0
+    excluded_particle_count = 0
+    interior = None
+
+    if complete_analysis and num_particles > 0:
+        logger.info(f"Starting contact calculation for r={r} with {num_particles} particles using connectivity={connectivity}")
+        try:
+            # Count contacts with guard volume filtering
+            # This counts contacts for ALL particles, but filters statistics to interior only
+            full_contacts, interior_contacts, guard_stats = count_contacts_with_guard(
+                labels,
+                connectivity=connectivity
+            )
+
+            # Use interior particles for mean contacts (primary metric)
+            if interior_contacts and len(interior_contacts) > 0:
+                interior_contact_values = list(interior_contacts.values())
+                mean_contacts = np.mean(interior_contact_values)
+
+                interior_particle_count = guard_stats['interior_particles']
+                excluded_particle_count = guard_stats['excluded_particles']
+                n_interior = len(interior_contacts)
+                interior = (
+                    np.fromiter(interior_contacts.keys(), dtype=np.int64, count=n_interior),
+                    np.fromiter(interior_contacts.values(), dtype=np.int64, count=n_interior),
+                    guard_stats,
+                )
+
+                logger.info(
+                    f"✅ Contact calculation successful for r={r}: "
+                    f"mean={mean_contacts:.1f} (interior particles only, "
+                    f"{interior_particle_count} interior / {guard_stats['total_particles']} total)"
+                )
+            else:
+                logger.warning(f"❌ No interior contacts returned for radius {r} (dict empty or None)")
+                mean_contacts = 0.0
+
+        except Exception as e:
+            logger.error(f"❌ Contact calculation failed for radius {r}: {e}")
+            import traceback
+            traceback.print_exc()
+            mean_contacts = 0.0
+    else:
+        if not complete_analysis:
+            logger.info(f"Skipping contact analysis for r={r} (complete_analysis=False)")
+        elif num_particles == 0:
+            logger.info(f"Skipping contact analysis for r={r} (no particles detected)")
+
+    logger.info(f"Final mean_contacts for r={r}: {mean_contacts:.1f}")
+
+    processing_time = time.time() - step_start_time
+
+    # Create result (labels_path is empty since we don't save intermediate files)
+    result = OptimizationResult(
+        radius=r,
+        particle_count=num_particles,
+        mean_contacts=mean_contacts,
+        largest_particle_ratio=largest_ratio,
+        processing_time=processing_time,
+        labels_path="",  # Empty for in-memory processing (only selected radius is saved)
+        total_volume=total_vol,
+        largest_particle_volume=largest_vol,
+        interior_particle_count=interior_particle_count,
+        excluded_particle_count=excluded_particle_count
+    )
+
+    return result, interior
+
+
+# Peak bytes per volume voxel of one _evaluate_radius call (about 55 measured:
+# float64 distance transform, int32 markers and labels, watershed queues and
+# contact keys), with some headroom
+_RADIUS_WORKER_BYTES_PER_VOXEL = 64
+
+
+def _available_memory() -> Optional[int]:
+    """Bytes of memory available to new processes, or None if unknown."""
+    if psutil is not None:
+        return int(psutil.virtual_memory().available)
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _radius_worker_count(volume: np.ndarray, n_jobs: int, n_radii: int) -> int:
+    """Processes for the radius sweep, capped by cores and available memory.
+
+    Every process holds its own full-size intermediates, so at most
+    ``available // (_RADIUS_WORKER_BYTES_PER_VOXEL * volume.size)`` run at once.
+    """
+    n_workers = min(n_jobs, n_radii, os.cpu_count() or 1)
+    available = _available_memory()
+    if available is not None and n_workers > 1:
+        fits = int(available // max(1, _RADIUS_WORKER_BYTES_PER_VOXEL * volume.size))
+        if fits < n_workers:
+            logger.info(f"Limiting radius processes to {max(1, fits)} of {n_workers} "
+                        f"by available memory ({available / 2**30:.1f} GiB)")
+            n_workers = max(1, fits)
+    return n_workers
+
+
+# Volume shared by the processes of _evaluate_radii_parallel (set once per process)
+_worker_volume: Optional[np.ndarray] = None
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+
+
+def _init_radius_worker(shm_name: str, shape: tuple, dtype: str) -> None:
+    """Map the parent's shared-memory volume (no copy) for this process."""
+    global _worker_volume, _worker_shm
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_volume = np.ndarray(shape, dtype=np.dtype(dtype), buffer=_worker_shm.buf)
+
+
+def _evaluate_radius_in_worker(r: int, connectivity: int, complete_analysis: bool):
+    return _evaluate_radius(_worker_volume, r, connectivity, complete_analysis)
+
+
+def _evaluate_radii_parallel(
+    volume: np.ndarray,
+    radii: List[int],
+    connectivity: int,
+    complete_analysis: bool,
+    n_workers: int,
+) -> Iterator[tuple[OptimizationResult, Optional[tuple]]]:
+    """Evaluate radii in a process pool, yielding results in *radii* order.
+
+    The volume is copied once into shared memory and mapped by every process,
+    so it is never pickled. Closing the generator cancels radii not yet started.
+    """
+    logger.info(f"Evaluating {len(radii)} radii in {n_workers} processes")
+    volume = np.ascontiguousarray(volume)
+    shm = shared_memory.SharedMemory(create=True, size=max(volume.nbytes, 1))
+    try:
+        np.ndarray(volume.shape, dtype=volume.dtype, buffer=shm.buf)[...] = volume
+        # "spawn" on every platform: forking after numba's parallel kernels have
+        # started their thread pool can leave the pool hanging
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_radius_worker,
+                                 initargs=(shm.name, volume.shape, volume.dtype.str)) as ex:
+            futures = [ex.submit(_evaluate_radius_in_worker, r, connectivity, complete_analysis)
+                       for r in radii]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
 def optimize_radius_advanced(
     vol_path: str | None,
     output_dir: str,
@@ -39,6 +237,10 @@ def optimize_radius_advanced(
     smoothing_window: Optional[int] = None,
     *,
     volume: Optional[np.ndarray] = None,
+    save_csv: bool = False,
+    compress_labels: bool = False,
+    n_jobs: int = 1,
+    cancel_check: Optional[Callable[[], bool]] = None,
 ) -> OptimizationSummary:
     """Advanced radius optimization with comprehensive analysis.
 
@@ -51,6 +253,16 @@ def optimize_radius_advanced(
         complete_analysis: If True, calculate all metrics including contacts
         early_stopping: If True, stop at plateau detection
         plateau_threshold: Threshold for plateau detection
+        save_csv: If True, also write the human-readable optimization_results.csv.
+            The results table is otherwise written once, as Feather; the CSV is
+            the fallback when Feather cannot be written (e.g. without pyarrow)
+        compress_labels: If True, save the selected labels as compressed
+            labels_r{best}.npz instead of labels_r{best}.npy
+        n_jobs: Number of processes for evaluating radii concurrently (1 = serial).
+            Ignored with early_stopping, which needs each result before the next;
+            capped by the memory available for per-process intermediates
+        cancel_check: Polled after each radius; returning True raises
+            OptimizationCancelled before anything is written
 
     Returns:
         OptimizationSummary with all results and best radius
@@ -61,6 +273,9 @@ def optimize_radius_advanced(
     summary = OptimizationSummary()
     start_time = time.time()
     prev_count: int | None = None
+    # Interior contact arrays per radius, kept so the selected radius can be
+    # written out without re-running contact analysis
+    interior_by_radius: dict[int, tuple] = {}
 
     logger.info(f"Starting advanced radius optimization for radii: {radii}")
 
@@ -70,108 +285,52 @@ def optimize_radius_advanced(
             raise ValueError("Either `volume` or `vol_path` must be provided")
         volume = np.load(str(vol_path)).astype(bool)
 
-    for i, r in enumerate(radii):
-        step_start_time = time.time()
-
-        # Run particle splitting in-memory
-        logger.info(f"Processing radius {r} ({i+1}/{len(radii)})...")
-        labels = split_particles_in_memory(volume, radius=r, connectivity=connectivity)
-        num_particles = int(labels.max())
-
-        # Calculate additional metrics
-        largest_ratio, largest_vol, total_vol = calculate_largest_particle_ratio(labels)
-
-        # Calculate mean contacts if requested (with guard volume filtering)
-        mean_contacts = 0.0
-        interior_particle_count = 0
-        excluded_particle_count = 0
-        
-        if complete_analysis and num_particles > 0:
-            logger.info(f"Starting contact calculation for r={r} with {num_particles} particles using connectivity={connectivity}")
-            try:
-                # Import guard volume functions
-                from ..contact.guard_volume import count_contacts_with_guard
-                logger.info(f"Successfully imported count_contacts_with_guard function")
-                
-                # Count contacts with guard volume filtering
-                # This counts contacts for ALL particles, but filters statistics to interior only
-                full_contacts, interior_contacts, guard_stats = count_contacts_with_guard(
-                    labels,
-                    connectivity=connectivity
-                )
-                
-                # Use interior particles for mean contacts (primary metric)
-                if interior_contacts and len(interior_contacts) > 0:
-                    interior_contact_values = list(interior_contacts.values())
-                    mean_contacts = np.mean(interior_contact_values)
-                    
-                    interior_particle_count = guard_stats['interior_particles']
-                    excluded_particle_count = guard_stats['excluded_particles']
-                    
-                    logger.info(
-                        f"✅ Contact calculation successful for r={r}: "
-                        f"mean={mean_contacts:.1f} (interior particles only, "
-                        f"{interior_particle_count} interior / {guard_stats['total_particles']} total)"
-                    )
-                else:
-                    logger.warning(f"❌ No interior contacts returned for radius {r} (dict empty or None)")
-                    mean_contacts = 0.0
-                    
-            except ImportError as e:
-                logger.error(f"❌ Import error for contact calculation (r={r}): {e}")
-                mean_contacts = 0.0
-            except Exception as e:
-                logger.error(f"❌ Contact calculation failed for radius {r}: {e}")
-                import traceback
-                traceback.print_exc()
-                mean_contacts = 0.0
-        else:
-            if not complete_analysis:
-                logger.info(f"Skipping contact analysis for r={r} (complete_analysis=False)")
-            elif num_particles == 0:
-                logger.info(f"Skipping contact analysis for r={r} (no particles detected)")
-                
-        logger.info(f"Final mean_contacts for r={r}: {mean_contacts:.1f}")
-
-        processing_time = time.time() - step_start_time
-
-        # Create result (labels_path is empty since we don't save intermediate files)
-        result = OptimizationResult(
-            radius=r,
-            particle_count=num_particles,
-            mean_contacts=mean_contacts,
-            largest_particle_ratio=largest_ratio,
-            processing_time=processing_time,
-            labels_path="",  # Empty for in-memory processing (only selected radius is saved)
-            total_volume=total_vol,
-            largest_particle_volume=largest_vol,
-            interior_particle_count=interior_particle_count,
-            excluded_particle_count=excluded_particle_count
-        )
-
-        summary.add_result(result)
-
-        # Call progress callback for real-time updates
-        if progress_callback:
-            try:
-                progress_callback(result)
-            except Exception as e:
-                logger.warning(f"Progress callback failed: {e}")
-
-        logger.info(
-            f"Radius {r}: {num_particles} particles, "
-            f"{largest_ratio:.1%} largest, "
-            f"{mean_contacts:.1f} avg contacts"
-        )
-
-        # Early stopping check
-        if early_stopping and prev_count is not None and prev_count > 0:
-            rel_change = abs(num_particles - prev_count) / prev_count
-            if rel_change < plateau_threshold:
-                logger.info(f"Early stopping at r={r} (plateau reached)")
-                break
+    n_workers = 1
+    if n_jobs > 1 and len(radii) > 1 and not early_stopping:
+        n_workers = _radius_worker_count(volume, n_jobs, len(radii))
+    if n_workers > 1:
+        evaluations = _evaluate_radii_parallel(volume, radii, connectivity, complete_analysis, n_workers)
+    else:
+        evaluations = (_evaluate_radius(volume, r, connectivity, complete_analysis) for r in radii)
+
+    with closing(evaluations):
+        for result, interior in evaluations:
+            r = result.radius
+            num_particles = result.particle_count
+            if interior is not None:
+                interior_by_radius[r] = interior
+
+            summary.add_result(result)
+
+            # Call progress callback for real-time updates
+            if progress_callback:
+                try:
+                    progress_callback(result)
+                except OptimizationCancelled:
+                    logger.info(f"Optimization cancelled after r={r}")
+                    raise
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
+
+            # Stop before the next radius (or the final selection) if asked to
+            if cancel_check is not None and cancel_check():
+                logger.info(f"Optimization cancelled after r={r}")
+                raise OptimizationCancelled()
+
+            logger.info(
+                f"Radius {r}: {num_particles} particles, "
+                f"{result.largest_particle_ratio:.1%} largest, "
+                f"{result.mean_contacts:.1f} avg contacts"
+            )
+
+            # Early stopping check
+            if early_stopping and prev_count is not None and prev_count > 0:
+                rel_change = abs(num_particles - prev_count) / prev_count
+                if rel_change < plateau_threshold:
+                    logger.info(f"Early stopping at r={r} (plateau reached)")
+                    break
         
-        prev_count = num_particles
+            prev_count = num_particles
 
     # Determine best radius using hard-constraint + peak particle count + contacts range
     try:
@@ -198,16 +357,8 @@ def optimize_radius_advanced(
     logger.info(f"Optimization completed in {summary.total_processing_time:.1f}s")
     logger.info(explanation)
 
-    # Save optimization_results.csv
-    try:
-        if pd is None:
-            logger.warning("pandas not available; skipping optimization_results.csv save")
-        else:
-            df = _summary_to_dataframe(summary)
-            df.to_csv(output_dir / "optimization_results.csv", index=False)
-            logger.info("Saved optimization_results.csv")
-    except Exception as e:
-        logger.warning(f"Failed to save optimization_results.csv: {e}")
+    # Save optimization_results.feather (CSV on request or as fallback)
+    _save_results_table(summary, output_dir, save_csv=save_csv)
 
     # Save only the selected labels to disk
     try:
@@ -216,8 +367,14 @@ def optimize_radius_advanced(
         sel_labels = None
         # Recompute labels for selected radius to avoid keeping all in memory
         sel_labels = split_particles_in_memory(volume, radius=sel_r, connectivity=connectivity)
-        np.save(output_dir / f"labels_r{sel_r}.npy", sel_labels.astype(np.int32))
-        logger.info(f"Saved labels_r{sel_r}.npy")
+        # Store labels in the narrowest unsigned dtype that holds the max label
+        # (usually uint16): smaller file, and every later pass reads less memory
+        sel_labels = sel_labels.astype(np.min_scalar_type(int(sel_labels.max())), copy=False)
+        saved_path = save_labels(sel_labels, output_dir / f"labels_r{sel_r}.npy", compress=compress_labels)
+        logger.info(f"Saved {saved_path.name}")
+        if sel_r in interior_by_radius:
+            _save_particle_stats(output_dir / f"particles_r{sel_r}.npz", sel_labels,
+                                 *interior_by_radius[sel_r])
     except Exception as e:
         logger.error(f"Failed to save selected labels: {e}")
 
@@ -253,7 +410,7 @@ def optimize_radius(
 
     return summary.best_radius, counts
 
-__all__ = ["optimize_radius_advanced", "optimize_radius"] 
+__all__ = ["optimize_radius_advanced", "optimize_radius", "OptimizationCancelled"] 
 
 
 # ---- New constraint-based selector (public helper) ---------------------------------------
@@ -414,6 +571,70 @@ def _select_radius_by_constraints_from_summary(
     )
 
 
+def _save_results_table(summary: "OptimizationSummary", output_dir: Path, save_csv: bool = False) -> None:
+    """Write the per-radius results table.
+
+    Feather is the primary format (needs pyarrow), so the table is serialised
+    once per run. The CSV copy for Excel and other external tools is written
+    when *save_csv* is True, or in place of Feather when that fails.
+    """
+    if pd is None:
+        logger.warning("pandas not available; skipping optimization_results save")
+        return
+    try:
+        df = _summary_to_dataframe(summary).reset_index(drop=True)
+    except Exception as e:
+        logger.warning(f"Failed to build optimization results table: {e}")
+        return
+
+    feather_saved = False
+    try:
+        df.to_feather(output_dir / "optimization_results.feather")
+        feather_saved = True
+        logger.info("Saved optimization_results.feather")
+    except ImportError:
+        logger.debug("pyarrow not available; writing optimization_results.csv instead")
+    except Exception as e:
+        logger.warning(f"Failed to save optimization_results.feather: {e}")
+
+    if save_csv or not feather_saved:
+        try:
+            buf = io.StringIO()
+            df.to_csv(buf, index=False)
+            with open(output_dir / "optimization_results.csv", "w", newline="", encoding="utf-8") as f:
+                f.write(buf.getvalue())
+            logger.info("Saved optimization_results.csv")
+        except Exception as e:
+            logger.warning(f"Failed to save optimization_results.csv: {e}")
+
+
+def _save_particle_stats(
+    path: Path,
+    labels: np.ndarray,
+    interior_ids: np.ndarray,
+    interior_contacts: np.ndarray,
+    guard_stats: dict,
+) -> None:
+    """Write per-particle arrays for the interior particles of *labels*.
+
+    The layout matches the GUI's interior-analysis cache (``contact_ids``,
+    ``contact_counts``, ``volume_ids``, ``volumes``, ``guard_stats``), so the
+    histogram step can load it instead of re-analysing the labels.
+    """
+    counts = np.bincount(labels.ravel(), minlength=int(interior_ids.max(initial=0)) + 1)
+    np.savez(
+        path,
+        contact_ids=interior_ids,
+        contact_counts=interior_contacts,
+        volume_ids=interior_ids,
+        volumes=counts[interior_ids].astype(np.int64, copy=False),
+        guard_stats=np.array([guard_stats['total_particles'],
+                              guard_stats['interior_particles'],
+                              guard_stats['excluded_particles']], dtype=np.int64),
+    )
+    logger.info(f"Saved {path.name}")
+
+
 def _summary_to_dataframe(summary: "OptimizationSummary"):
     if pd is None:
         raise RuntimeError("pandas is required for _summary_to_dataframe")